@@ -1,12 +1,51 @@
 """
 저장된 데이터 확인
 
-월 단위로 저장된 parquet 및 csv 파일을 읽어서 확인
+월 단위로 저장된 parquet 및 feather 파일, 파티셔닝 데이터셋을 읽어서 확인
 """
 
-import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from pathlib import Path
 
+# 프로젝트 루트 경로
+project_root = Path(__file__).parent.parent
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def column_statistics(pf: pq.ParquetFile, column: str):
+    """
+    Parquet footer의 row group 통계만으로 컬럼의 최소/최대값 계산 (데이터 페이지 디코딩 없음)
+
+    매개변수:
+        pf: 메모리 맵으로 연 ParquetFile
+        column: 컬럼명
+
+    반환값:
+        (최소값, 최대값) 튜플
+    """
+    index = pf.schema_arrow.get_field_index(column)
+    stats = [pf.metadata.row_group(i).column(index).statistics for i in range(pf.metadata.num_row_groups)]
+    return min(s.min for s in stats), max(s.max for s in stats)
+
+
+def read_tail(pf: pq.ParquetFile, n: int = 5):
+    """
+    마지막 row group만 읽어서 최근 n개 행 반환
+
+    매개변수:
+        pf: 메모리 맵으로 연 ParquetFile
+        n: 행 수
+
+    반환값:
+        최근 n개 행 DataFrame
+    """
+    last = pf.read_row_group(pf.metadata.num_row_groups - 1, columns=OHLCV_COLUMNS)
+    return last.slice(max(0, last.num_rows - n)).to_pandas()
+
 
 def check_saved_data():
     """저장된 데이터 확인"""
@@ -15,49 +54,69 @@ def check_saved_data():
     print("💾 저장된 데이터 확인")
     print("=" * 80)
 
-    # CSV 파일
-    csv_file = Path('data/csv/BTC_USDT_2024_12_1m.csv')
-    if csv_file.exists():
-        print(f"\n📄 CSV: {csv_file}")
-        df_csv = pd.read_csv(csv_file)
-        df_csv['timestamp'] = pd.to_datetime(df_csv['timestamp'])
+    # Feather 파일 (메모리 맵으로 읽기)
+    feather_file = project_root / 'data/feather/BTC_USDT_2024_12_1m.feather'
+    if feather_file.exists():
+        print(f"\n⚡ Feather: {feather_file}")
+        # LZ4 압축 파일도 필요한 슬라이스만 pandas로 변환
+        table_feather = feather.read_table(feather_file, memory_map=True)
 
-        print(f"  - 행: {len(df_csv):,}개")
-        print(f"  - 크기: {csv_file.stat().st_size / (1024*1024):.2f} MB")
-        print(f"  - 컬럼: {list(df_csv.columns)}")
+        print(f"  - 행: {table_feather.num_rows:,}개")
+        print(f"  - 크기: {feather_file.stat().st_size / (1024*1024):.2f} MB")
+        print(f"  - 컬럼: {table_feather.column_names}")
         print(f"\n  최근 5개:")
-        print(df_csv.tail(5).to_string(index=False))
+        print(table_feather.slice(max(0, table_feather.num_rows - 5)).to_pandas().to_string(index=False))
     else:
-        print(f"\n⚠️  CSV 파일 없음: {csv_file}")
+        print(f"\n⚠️  Feather 파일 없음: {feather_file}")
 
     # Parquet 파일
     parquet_file = project_root / 'data/parquet/BTC_USDT_2024_12_1m.parquet'
     if parquet_file.exists():
         print(f"\n\n📦 Parquet: {parquet_file}")
-        df_parquet = pd.read_parquet(parquet_file)
+        # 메모리 맵 + footer 메타데이터만 사용 (파일 크기와 무관하게 일정한 메모리)
+        pf = pq.ParquetFile(parquet_file, memory_map=True)
+        tail_parquet = read_tail(pf)
 
-        print(f"  - 행: {len(df_parquet):,}개")
+        print(f"  - 행: {pf.metadata.num_rows:,}개")
         print(f"  - 크기: {parquet_file.stat().st_size / (1024*1024):.2f} MB")
-        print(f"  - 압축률: {(1 - parquet_file.stat().st_size / csv_file.stat().st_size) * 100:.1f}% 절감")
-        print(f"  - 컬럼: {list(df_parquet.columns)}")
+        if feather_file.exists():
+            print(f"  - 압축률: Feather 대비 {(1 - parquet_file.stat().st_size / feather_file.stat().st_size) * 100:.1f}% 절감")
+        print(f"  - 컬럼: {pf.schema_arrow.names}")
+        print(f"  - Row group: {pf.metadata.num_row_groups}개")
         print(f"\n  최근 5개:")
-        print(df_parquet.tail(5).to_string(index=False))
+        print(tail_parquet.to_string(index=False))
     else:
         print(f"\n⚠️  Parquet 파일 없음: {parquet_file}")
 
+    # 파티셔닝 데이터셋 (year/month 조건으로 해당 파티션만 읽기)
+    dataset_dir = project_root / 'data/parquet/dataset/BTC_USDT_1m'
+    if dataset_dir.exists():
+        print(f"\n\n🗂️  Parquet 데이터셋: {dataset_dir}")
+        dataset = ds.dataset(dataset_dir, format='parquet', partitioning='hive')
+        month_table = dataset.to_table(
+            columns=['timestamp', 'close'],
+            filter=(ds.field('year') == 2024) & (ds.field('month') == 12)
+        )
+
+        print(f"  - 파티션 파일: {len(dataset.files)}개")
+        print(f"  - 전체 행: {dataset.count_rows():,}개")
+        print(f"  - 2024년 12월 행: {month_table.num_rows:,}개")
+    else:
+        print(f"\n⚠️  Parquet 데이터셋 없음: {dataset_dir}")
+
     # 무결성 확인
-    if csv_file.exists() and parquet_file.exists():
+    if feather_file.exists() and parquet_file.exists():
         print("\n\n🔍 데이터 무결성:")
-        print(f"  CSV 행: {len(df_csv):,}")
-        print(f"  Parquet 행: {len(df_parquet):,}")
+        print(f"  Feather 행: {table_feather.num_rows:,}")
+        print(f"  Parquet 행: {pf.metadata.num_rows:,}")
 
-        if len(df_csv) == len(df_parquet):
+        if table_feather.num_rows == pf.metadata.num_rows:
             print("  ✓ 행 수 일치")
         else:
             print("  ❌ 행 수 불일치!")
 
         # 가격 비교
-        if df_csv['close'].iloc[-1] == df_parquet['close'].iloc[-1]:
+        if table_feather['close'][-1].as_py() == tail_parquet['close'].iloc[-1]:
             print("  ✓ 마지막 종가 일치")
         else:
             print("  ❌ 마지막 종가 불일치!")
@@ -66,19 +125,29 @@ def check_saved_data():
     print("✅ 확인 완료!")
     print("=" * 80)
 
-    # 통계
-    print("\n📊 2024년 12월 BTC/USDT:")
-    print(f"  시작: {df_parquet['timestamp'].min()} (UTC)")
-    print(f"  종료: {df_parquet['timestamp'].max()} (UTC)")
-    print(f"  기간: {(df_parquet['timestamp'].max() - df_parquet['timestamp'].min()).days}일")
-    print(f"  최고가: ${df_parquet['high'].max():,.2f}")
-    print(f"  최저가: ${df_parquet['low'].min():,.2f}")
-    print(f"  시작가: ${df_parquet['open'].iloc[0]:,.2f}")
-    print(f"  종료가: ${df_parquet['close'].iloc[-1]:,.2f}")
-    print(f"  변화율: {((df_parquet['close'].iloc[-1] / df_parquet['open'].iloc[0] - 1) * 100):+.2f}%")
-    print(f"  총 거래량: {df_parquet['volume'].sum():,.2f} BTC")
-    print(f"  평균 거래량: {df_parquet['volume'].mean():,.2f} BTC/분")
+    if not parquet_file.exists():
+        return
+
+    # 통계 (최고/최저/기간은 footer 통계, 시작/종료가는 첫/마지막 row group, 거래량은 volume 컬럼만 읽음)
+    ts_min, ts_max = column_statistics(pf, 'timestamp')
+    _, high_max = column_statistics(pf, 'high')
+    low_min, _ = column_statistics(pf, 'low')
+    first_open = pf.read_row_group(0, columns=['open'])['open'][0].as_py()
+    last_close = tail_parquet['close'].iloc[-1]
+    volume = pf.read(columns=['volume'])['volume']
+    volume_sum = pc.sum(volume).as_py()
 
+    print("\n📊 2024년 12월 BTC/USDT:")
+    print(f"  시작: {ts_min} (UTC)")
+    print(f"  종료: {ts_max} (UTC)")
+    print(f"  기간: {(ts_max - ts_min).days}일")
+    print(f"  최고가: ${high_max:,.2f}")
+    print(f"  최저가: ${low_min:,.2f}")
+    print(f"  시작가: ${first_open:,.2f}")
+    print(f"  종료가: ${last_close:,.2f}")
+    print(f"  변화율: {((last_close / first_open - 1) * 100):+.2f}%")
+    print(f"  총 거래량: {volume_sum:,.2f} BTC")
+    print(f"  평균 거래량: {volume_sum / len(volume):,.2f} BTC/분")
 
 if __name__ == "__main__":
     check_saved_data()
@@ -2,20 +2,182 @@
 월 단위 암호화폐 가격 데이터 저장 스크립트
 
 바이낸스에서 분봉 데이터를 월 단위로 수집하여
-parquet 및 csv 형식으로 저장합니다.
+parquet 및 feather 형식으로 저장합니다. (csv는 선택 사항)
 """
 
+import hashlib
 import os
-from datetime import datetime, timedelta
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from src.data_collector import DataCollector
 
+# 프로젝트 루트 (기본 data 폴더 위치)
+project_root = Path(__file__).parent.parent
+
+
+def open_parquet_writer(parquet_path: Path, schema: pa.Schema) -> pq.ParquetWriter:
+    """
+    공통 Parquet 저장 옵션으로 ParquetWriter 생성
+
+    ZSTD(레벨 3) 압축을 사용하고, 단조 증가하는 timestamp 컬럼은 델타 인코딩,
+    나머지 컬럼은 딕셔너리 인코딩을 적용합니다.
+    컬럼 통계(min/max)를 기록하여 읽기 시 조건 필터링(predicate pushdown)이 가능합니다.
+
+    매개변수:
+        parquet_path: 저장 경로
+        schema: 저장할 테이블 스키마
+
+    반환값:
+        ParquetWriter
+    """
+    # column_encoding을 지정한 컬럼은 딕셔너리 인코딩 대상에서 제외해야 함
+    dictionary_columns = [name for name in schema.names if name != 'timestamp']
+
+    return pq.ParquetWriter(
+        parquet_path,
+        schema,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=dictionary_columns,
+        column_encoding={'timestamp': 'DELTA_BINARY_PACKED'},
+        data_page_version='2.0',
+        write_statistics=True
+    )
+
+
+def write_parquet(df: pd.DataFrame, parquet_path: Path, batch_size: int = 65536):
+    """
+    OHLCV 데이터프레임을 Parquet 파일로 저장
+
+    ParquetWriter로 RecordBatch 단위 스트리밍 저장하여 전체 테이블 사본을 한 번 더 만들지 않습니다.
+
+    매개변수:
+        df: 저장할 데이터프레임 (timestamp 컬럼 필수)
+        parquet_path: 저장 경로
+        batch_size: RecordBatch 하나의 최대 행 수 (기본: 65536, 1분봉 약 1.5개월)
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # pandas 메타데이터 블록 제외 (인덱스를 저장하지 않으므로 불필요)
+    schema = table.schema.remove_metadata()
+
+    with open_parquet_writer(parquet_path, schema) as writer:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            writer.write_batch(batch.replace_schema_metadata(None))
+
+
+def write_feather(df: pd.DataFrame, feather_path: Path):
+    """
+    OHLCV 데이터프레임을 Feather v2 (Arrow IPC) 파일로 저장
+
+    CSV보다 쓰기/읽기가 훨씬 빠르고 타입(datetime, float)이 그대로 유지되는 중간 저장 형식입니다.
+    LZ4 압축을 사용하며, 읽을 때 메모리 맵으로 바로 열 수 있습니다.
+
+    매개변수:
+        df: 저장할 데이터프레임
+        feather_path: 저장 경로
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    feather.write_feather(table, feather_path, compression='lz4', compression_level=1)
+
+
+def write_dataset_partition(df: pd.DataFrame, dataset_dir: Path):
+    """
+    월 데이터를 year/month로 파티셔닝된 Hive 형식 Parquet 데이터셋에 저장
+
+    dataset_dir/year=2024/month=12/... 구조로 저장되므로, 여러 해에 걸친 데이터를
+    ds.dataset(dataset_dir, partitioning='hive')로 한 번에 열고
+    year/month/timestamp 조건으로 필요한 파일과 row group만 읽을 수 있습니다.
+
+    매개변수:
+        df: 저장할 데이터프레임 (한 달 분량)
+        dataset_dir: 데이터셋 루트 디렉토리
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # 파티션 컬럼 추가 (pandas 복사 없이 Arrow에서 계산)
+    table = table.append_column('year', pc.year(table['timestamp']))
+    table = table.append_column('month', pc.month(table['timestamp']))
+
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format='parquet',
+        partitioning=['year', 'month'],
+        partitioning_flavor='hive',
+        # 같은 월을 다시 저장하면 해당 파티션만 교체
+        existing_data_behavior='delete_matching',
+        file_options=ds.ParquetFileFormat().make_write_options(compression='zstd')
+    )
+
+
+def write_month_files(df: pd.DataFrame, parquet_path: Path = None, feather_path: Path = None,
+                      csv_path: Path = None, dataset_dir: Path = None) -> list:
+    """
+    월 데이터를 지정된 형식의 파일로 저장
+
+    모듈 수준 함수이므로 ProcessPoolExecutor 작업 프로세스에서도 실행할 수 있습니다.
+
+    매개변수:
+        df: 저장할 데이터프레임
+        parquet_path: Parquet 저장 경로 (None이면 저장 안 함)
+        feather_path: Feather 저장 경로 (None이면 저장 안 함)
+        csv_path: CSV 저장 경로 (None이면 저장 안 함)
+        dataset_dir: 파티셔닝 데이터셋 루트 디렉토리 (None이면 저장 안 함)
+
+    반환값:
+        저장된 파일 경로 리스트
+    """
+    saved_files = []
+
+    # CSV 저장
+    if csv_path is not None:
+        print(f"\n💾 CSV 파일 저장 중: {csv_path}")
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        file_size_mb = csv_path.stat().st_size / (1024 * 1024)
+        print(f"✓ CSV 저장 완료 (크기: {file_size_mb:.2f} MB)")
+        saved_files.append(str(csv_path))
+
+    # Feather 저장
+    if feather_path is not None:
+        print(f"\n💾 Feather 파일 저장 중: {feather_path}")
+        write_feather(df, feather_path)
+        file_size_mb = feather_path.stat().st_size / (1024 * 1024)
+        print(f"✓ Feather 저장 완료 (크기: {file_size_mb:.2f} MB)")
+        saved_files.append(str(feather_path))
+
+    # Parquet 저장
+    if parquet_path is not None:
+        print(f"\n💾 Parquet 파일 저장 중: {parquet_path}")
+        write_parquet(df, parquet_path)
+        file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
+        print(f"✓ Parquet 저장 완료 (크기: {file_size_mb:.2f} MB)")
+        saved_files.append(str(parquet_path))
+
+    # 파티셔닝 데이터셋 저장
+    if dataset_dir is not None:
+        print(f"\n💾 Parquet 데이터셋 저장 중: {dataset_dir}")
+        write_dataset_partition(df, dataset_dir)
+        print(f"✓ Parquet 데이터셋 저장 완료")
+        saved_files.append(str(dataset_dir))
+
+    return saved_files
+
 
 class MonthlyDataSaver:
     """월 단위 데이터 저장 관리자"""
 
-    def __init__(self, symbol: str = 'BTC/USDT', timeframe: str = '1m', data_dir: str = None):
+    def __init__(self, symbol: str = 'BTC/USDT', timeframe: str = '1m', data_dir: str = None,
+                 collector: DataCollector = None):
         """
         초기화
 
@@ -23,6 +185,7 @@ class MonthlyDataSaver:
             symbol: 거래쌍 (예: 'BTC/USDT')
             timeframe: 캔들 간격 (예: '1m' - 1분봉)
             data_dir: 데이터 저장 디렉토리 (기본: 프로젝트/data)
+            collector: 공유할 데이터 수집기 (기본: 새로 생성)
         """
         self.symbol = symbol
         self.timeframe = timeframe
@@ -31,13 +194,28 @@ class MonthlyDataSaver:
         if data_dir is None:
             data_dir = project_root / 'data'
         self.data_dir = Path(data_dir)
-        self.collector = DataCollector(symbol=symbol, timeframe=timeframe)
+        if collector is None:
+            collector = DataCollector(symbol=symbol, timeframe=timeframe)
+        self.collector = collector
 
-        # 데이터 저장 디렉토리 생성
+        # 데이터 저장 디렉토리 생성 (CSV 디렉토리는 CSV 저장 시에만 생성)
         self.parquet_dir = self.data_dir / 'parquet'
+        self.feather_dir = self.data_dir / 'feather'
         self.csv_dir = self.data_dir / 'csv'
+        # year/month 파티셔닝 데이터셋 (심볼/타임프레임별)
+        self.dataset_dir = self.parquet_dir / 'dataset' / f"{symbol.replace('/', '_')}_{timeframe}"
         self.parquet_dir.mkdir(parents=True, exist_ok=True)
-        self.csv_dir.mkdir(parents=True, exist_ok=True)
+        self.feather_dir.mkdir(parents=True, exist_ok=True)
+
+        # 저장 완료된 월 목록 (파일 시스템을 월마다 확인하지 않도록 sqlite에 기록)
+        self.manifest = sqlite3.connect(self.data_dir / 'manifest.db')
+        with self.manifest:
+            self.manifest.execute(
+                "CREATE TABLE IF NOT EXISTS saved ("
+                "symbol TEXT, timeframe TEXT, year INTEGER, month INTEGER, "
+                "rows INTEGER, sha256 TEXT, bytes INTEGER, "
+                "UNIQUE(symbol, timeframe, year, month))"
+            )
 
     def get_month_range(self, year: int, month: int) -> tuple:
         """
@@ -50,34 +228,272 @@ class MonthlyDataSaver:
         반환값:
             (시작일, 종료일) 튜플
         """
-        start_date = datetime(year, month, 1)
+        start_date = pd.Timestamp(year=year, month=month, day=1)
 
-        # 다음 달 첫날을 구한 후 하루 빼기
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
+        # 해당 월의 마지막 날
+        end_date = start_date + pd.offsets.MonthEnd(0)
 
         return start_date, end_date
 
-    def save_month_data(self, year: int, month: int, save_csv: bool = True, save_parquet: bool = True):
+    def get_file_base(self, year: int, month: int) -> str:
         """
-        특정 월의 데이터를 수집하여 저장
+        특정 월의 파일명(확장자 제외) 반환
 
         매개변수:
             year: 연도
             month: 월 (1-12)
-            save_csv: CSV 파일로 저장 여부
-            save_parquet: Parquet 파일로 저장 여부
-        """
-        # 월 범위 계산
-        start_date, end_date = self.get_month_range(year, month)
 
+        반환값:
+            파일명 (예: BTC_USDT_2024_01_1m)
+        """
         # 심볼에서 / 제거 (파일명용)
         symbol_safe = self.symbol.replace('/', '_')
 
+        return f"{symbol_safe}_{year}_{month:02d}_{self.timeframe}"
+
+    def get_year_path(self, year: int) -> Path:
+        """
+        연 단위 Parquet 파일 경로 반환 (save_year로 저장)
+
+        매개변수:
+            year: 연도
+
+        반환값:
+            파일 경로 (예: .../parquet/BTC_USDT_2024_1m.parquet)
+        """
+        symbol_safe = self.symbol.replace('/', '_')
+
+        return self.parquet_dir / f"{symbol_safe}_{year}_{self.timeframe}.parquet"
+
+    def is_month_saved(self, year: int, month: int, saved_paths: list) -> bool:
+        """
+        특정 월의 데이터가 이미 저장되어 있는지 확인
+
+        요청된 파일이 모두 존재하면 저장된 것으로 판단합니다.
+        진행 중인 월(이번 달)은 현재 시각까지의 예상 캔들 수와 Parquet 메타데이터의 행 수를 비교하여
+        부족하면 다시 수집하도록 False를 반환합니다.
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            saved_paths: 확인할 파일 경로 리스트
+
+        반환값:
+            이미 저장되어 있으면 True
+        """
+        if not saved_paths or not all(path.exists() for path in saved_paths):
+            return False
+
+        # 지난 달은 데이터가 더 이상 바뀌지 않음
+        if self.is_month_complete(year, month):
+            return True
+
+        # 진행 중인 월: 현재까지 예상 캔들 수와 Parquet 행 수 비교
+        parquet_path = self.parquet_dir / f"{self.get_file_base(year, month)}.parquet"
+        if not parquet_path.exists():
+            return False
+
+        return self.is_month_complete(year, month, pq.read_metadata(parquet_path).num_rows)
+
+    def is_month_complete(self, year: int, month: int, rows: int = 0) -> bool:
+        """
+        저장된 행 수로 해당 월 데이터가 최신인지 확인
+
+        지난 달은 항상 True, 진행 중인 월은 현재 시각까지의 예상 캔들 수 이상이면 True를 반환합니다.
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            rows: 저장된 행 수
+
+        반환값:
+            다시 수집할 필요가 없으면 True
+        """
+        start_date, end_date = self.get_month_range(year, month)
+        now = pd.Timestamp.now(tz='UTC').tz_localize(None)
+
+        if now >= end_date + pd.Timedelta(days=1):
+            return True
+
+        timeframe_ms = self.collector.exchange.parse_timeframe(self.timeframe) * 1000
+        expected_rows = int((now - start_date).total_seconds() * 1000 // timeframe_ms)
+        return rows >= expected_rows
+
+    def get_saved_months(self) -> dict:
+        """
+        manifest에 기록된 저장 완료 월 목록 반환 (쿼리 한 번, 파일 시스템 접근 없음)
+
+        반환값:
+            {(연도, 월): 행 수} 딕셔너리
+        """
+        rows = self.manifest.execute(
+            "SELECT year, month, rows FROM saved WHERE symbol = ? AND timeframe = ?",
+            (self.symbol, self.timeframe)
+        )
+        return {(year, month): count for year, month, count in rows}
+
+    def record_saved_month(self, year: int, month: int, rows: int, paths: tuple):
+        """
+        저장 완료된 월을 manifest에 기록 (같은 월은 덮어씀)
+
+        대표 파일(Parquet > Feather > CSV)의 크기와 SHA-256을 함께 기록하여
+        파일을 읽지 않고도 손상/변경 여부를 확인할 수 있게 합니다.
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            rows: 저장된 행 수
+            paths: (parquet 경로, feather 경로, csv 경로) 튜플
+        """
+        # 연 단위 파일로 합쳐진 월은 연 파일로 기록
+        candidates = [path for path in paths if path] + [self.get_year_path(year)]
+        path = next(path for path in candidates if path.exists())
+
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+
+        with self.manifest:
+            self.manifest.execute(
+                "INSERT OR REPLACE INTO saved (symbol, timeframe, year, month, rows, sha256, bytes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.symbol, self.timeframe, year, month, rows, sha256.hexdigest(), path.stat().st_size)
+            )
+
+    def get_dataset_partition(self, year: int, month: int) -> Path:
+        """
+        파티셔닝 데이터셋에서 특정 월의 파티션 디렉토리 반환
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+
+        반환값:
+            파티션 디렉토리 경로 (예: .../dataset/BTC_USDT_1m/year=2024/month=12)
+        """
+        return self.dataset_dir / f"year={year}" / f"month={month}"
+
+    def get_month_paths(self, year: int, month: int, save_csv: bool = False, save_parquet: bool = True,
+                        save_feather: bool = True) -> tuple:
+        """
+        특정 월의 저장 파일 경로 반환
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            save_csv: CSV 경로 포함 여부
+            save_parquet: Parquet 경로 포함 여부
+            save_feather: Feather 경로 포함 여부
+
+        반환값:
+            (parquet 경로, feather 경로, csv 경로) 튜플 - 저장하지 않는 형식은 None
+        """
         # 파일명 생성 (예: BTC_USDT_2024_01_1m)
-        file_base = f"{symbol_safe}_{year}_{month:02d}_{self.timeframe}"
+        file_base = self.get_file_base(year, month)
+
+        parquet_path = self.parquet_dir / f"{file_base}.parquet" if save_parquet else None
+        feather_path = self.feather_dir / f"{file_base}.feather" if save_feather else None
+        csv_path = self.csv_dir / f"{file_base}.csv" if save_csv else None
+
+        return parquet_path, feather_path, csv_path
+
+    def _saved_targets(self, year: int, month: int, paths: tuple, save_dataset: bool) -> list:
+        """저장 여부 확인 대상 경로 리스트 (파일 경로 + 데이터셋 파티션)"""
+        targets = [path for path in paths if path]
+
+        # 연 단위 파일로 합쳐진 월은 연 파일로 확인
+        parquet_path = paths[0]
+        if parquet_path is not None and not parquet_path.exists() and self.get_year_path(year).exists():
+            targets[0] = self.get_year_path(year)
+        if save_dataset:
+            targets.append(self.get_dataset_partition(year, month))
+        return targets
+
+    def _load_for_missing_outputs(self, year: int, month: int, paths: tuple, save_dataset: bool):
+        """
+        빠진 형식만 만들 수 있도록 이미 저장된 파일에서 월 데이터를 읽음 (바이낸스 재수집 없음)
+
+        예전에 Parquet/CSV로만 저장한 월에 Feather나 데이터셋 저장을 요청한 경우,
+        저장된 파일을 읽어서 없는 형식만 새로 씁니다. 진행 중인 월은 다시 수집해야 하므로 제외합니다.
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            paths: 요청된 (parquet 경로, feather 경로, csv 경로) 튜플
+            save_dataset: 파티셔닝 데이터셋 저장 요청 여부
+
+        반환값:
+            (데이터프레임, 새로 저장할 경로 튜플, 데이터셋 디렉토리) - 로컬 파일로 채울 수 없으면 None
+        """
+        if not self.is_month_complete(year, month):
+            return None
+
+        parquet_path, feather_path, csv_path = self.get_month_paths(year, month, save_csv=True)
+        year_path = self.get_year_path(year)
+        if not any(path.exists() for path in (parquet_path, year_path, feather_path, csv_path)):
+            return None
+
+        # 이미 있는 파일은 다시 쓰지 않음 (연 단위 파일에 합쳐진 월은 Parquet 저장 불필요)
+        write_paths = tuple(path if path is not None and not path.exists() else None for path in paths)
+        if write_paths[0] is not None and year_path.exists():
+            write_paths = (None,) + write_paths[1:]
+        dataset_dir = None
+        if save_dataset and not self.get_dataset_partition(year, month).exists():
+            dataset_dir = self.dataset_dir
+
+        df = self.load_month_data(year, month)
+        if df.empty:
+            return None
+
+        # 예전 파일(timestamp[ns]/double)을 새로 수집한 데이터와 같은 자료형으로 맞춤
+        df['timestamp'] = df['timestamp'].astype('datetime64[ms]')
+        value_columns = df.columns.drop('timestamp')
+        df[value_columns] = df[value_columns].astype(self.collector.dtype)
+
+        return df, write_paths, dataset_dir
+
+    def load_month_data(self, year: int, month: int) -> pd.DataFrame:
+        """
+        저장된 월 데이터를 읽어서 반환 (Parquet > 연 단위 Parquet > Feather > CSV 순서로 사용)
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+
+        반환값:
+            저장된 데이터프레임
+        """
+        parquet_path, feather_path, csv_path = self.get_month_paths(year, month, save_csv=True)
+
+        year_path = self.get_year_path(year)
+
+        if parquet_path.exists():
+            return pd.read_parquet(parquet_path)
+        if year_path.exists():
+            # row group(월) 통계로 해당 월만 읽음
+            start_date, end_date = self.get_month_range(year, month)
+            return pd.read_parquet(year_path, filters=[
+                ('timestamp', '>=', start_date),
+                ('timestamp', '<', end_date + pd.Timedelta(days=1))
+            ])
+        if feather_path.exists():
+            return feather.read_table(feather_path).to_pandas()
+        return pd.read_csv(csv_path, parse_dates=['timestamp'])
+
+    def fetch_month_data(self, year: int, month: int) -> pd.DataFrame:
+        """
+        특정 월의 데이터를 바이낸스에서 수집하고 검증 (저장은 하지 않음)
+
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+
+        반환값:
+            수집된 데이터프레임 (데이터가 없으면 None)
+        """
+        # 월 범위 계산
+        start_date, end_date = self.get_month_range(year, month)
 
         print("=" * 80)
         print(f"📅 {year}년 {month}월 데이터 수집 시작")
@@ -87,55 +503,80 @@ class MonthlyDataSaver:
         print(f"기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
         print("")
 
+        # 데이터 수집
+        print("바이낸스에서 데이터 수집 중...")
         try:
-            # 데이터 수집
-            print("바이낸스에서 데이터 수집 중...")
             df = self.collector.fetch_all_historical_data(
                 start_date=start_date.strftime('%Y-%m-%d'),
                 end_date=end_date.strftime('%Y-%m-%d')
             )
+        except ValueError as e:
+            # 상장 이전 월 등 기간 내 캔들이 하나도 없으면 ValueError 발생
+            print(f"⚠️  수집된 데이터가 없습니다 ({e})")
+            return None
 
-            if df.empty:
-                print("⚠️  수집된 데이터가 없습니다")
-                return None
+        if df.empty:
+            print("⚠️  수집된 데이터가 없습니다")
+            return None
+
+        print(f"✓ 총 {len(df):,}개 캔들 수집 완료")
+
+        # 데이터 검증
+        print("\n데이터 검증 중...")
+        if self.collector.validate_data(df):
+            print("✓ 데이터 검증 완료")
+        else:
+            print("⚠️  데이터 검증 실패 (그래도 저장은 진행합니다)")
+
+        # 통계
+        print(f"\n📊 데이터 통계:")
+        print(f"  - 시작: {df['timestamp'].min()} (UTC)")
+        print(f"  - 종료: {df['timestamp'].max()} (UTC)")
+        print(f"  - 최고가: ${df['high'].max():,.2f}")
+        print(f"  - 최저가: ${df['low'].min():,.2f}")
+        print(f"  - 평균 종가: ${df['close'].mean():,.2f}")
+        print(f"  - 총 거래량: {df['volume'].sum():,.2f}")
+
+        return df
+
+    def save_month_data(self, year: int, month: int, save_csv: bool = False, save_parquet: bool = True,
+                        save_feather: bool = True, save_dataset: bool = True, force: bool = False):
+        """
+        특정 월의 데이터를 수집하여 저장
+
+        이미 저장된 월은 바이낸스에서 다시 수집하지 않고 저장된 파일을 읽어서 반환합니다.
 
-            print(f"✓ 총 {len(df):,}개 캔들 수집 완료")
+        매개변수:
+            year: 연도
+            month: 월 (1-12)
+            save_csv: CSV 파일로 저장 여부 (기본: 저장 안 함, 필요 시 명시적으로 지정)
+            save_parquet: Parquet 파일로 저장 여부
+            save_feather: Feather 파일로 저장 여부 (빠른 중간 저장 형식)
+            save_dataset: year/month 파티셔닝 Parquet 데이터셋에도 저장 여부
+            force: True면 이미 저장된 월도 다시 수집
+        """
+        paths = self.get_month_paths(year, month, save_csv, save_parquet, save_feather)
+        dataset_dir = self.dataset_dir if save_dataset else None
 
-            # 데이터 검증
-            print("\n데이터 검증 중...")
-            if self.collector.validate_data(df):
-                print("✓ 데이터 검증 완료")
+        # 이미 저장된 월은 네트워크 요청 없이 건너뛰기
+        if not force and self.is_month_saved(year, month, self._saved_targets(year, month, paths, save_dataset)):
+            print(f"⏭️  {year}년 {month}월 데이터 이미 저장됨 - 건너뜀")
+            return self.load_month_data(year, month)
+
+        try:
+            # 다른 형식으로 저장된 지난 달은 저장 파일에서 빠진 형식만 생성
+            local = None if force else self._load_for_missing_outputs(year, month, paths, save_dataset)
+            if local is not None:
+                print(f"📂 {year}년 {month}월 저장 파일에서 빠진 형식만 생성")
+                df, write_paths, write_dataset_dir = local
             else:
-                print("⚠️  데이터 검증 실패 (그래도 저장은 진행합니다)")
-
-            # 통계
-            print(f"\n📊 데이터 통계:")
-            print(f"  - 시작: {df['timestamp'].min()} (UTC)")
-            print(f"  - 종료: {df['timestamp'].max()} (UTC)")
-            print(f"  - 최고가: ${df['high'].max():,.2f}")
-            print(f"  - 최저가: ${df['low'].min():,.2f}")
-            print(f"  - 평균 종가: ${df['close'].mean():,.2f}")
-            print(f"  - 총 거래량: {df['volume'].sum():,.2f}")
-
-            saved_files = []
-
-            # CSV 저장
-            if save_csv:
-                csv_path = self.csv_dir / f"{file_base}.csv"
-                print(f"\n💾 CSV 파일 저장 중: {csv_path}")
-                df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                file_size_mb = csv_path.stat().st_size / (1024 * 1024)
-                print(f"✓ CSV 저장 완료 (크기: {file_size_mb:.2f} MB)")
-                saved_files.append(str(csv_path))
-
-            # Parquet 저장
-            if save_parquet:
-                parquet_path = self.parquet_dir / f"{file_base}.parquet"
-                print(f"\n💾 Parquet 파일 저장 중: {parquet_path}")
-                df.to_parquet(parquet_path, index=False, compression='snappy')
-                file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
-                print(f"✓ Parquet 저장 완료 (크기: {file_size_mb:.2f} MB)")
-                saved_files.append(str(parquet_path))
+                df = self.fetch_month_data(year, month)
+                write_paths, write_dataset_dir = paths, dataset_dir
+            if df is None:
+                return None
+
+            write_month_files(df, *write_paths, dataset_dir=write_dataset_dir)
+            self.record_saved_month(year, month, len(df), paths)
 
             print("\n" + "=" * 80)
             print(f"🎉 {year}년 {month}월 데이터 저장 완료!")
@@ -149,20 +590,104 @@ class MonthlyDataSaver:
             traceback.print_exc()
             return None
 
+    def save_year(self, year: int, remove_monthly: bool = True) -> Path:
+        """
+        한 해의 12개월 데이터를 하나의 Parquet 파일로 저장 (월별 row group 1개)
+
+        월마다 파일을 따로 쓰는 대신 ParquetWriter 하나로 12개월을 이어서 저장하여
+        파일 수와 파일 시스템 호출을 줄입니다. row group마다 timestamp min/max 통계가
+        기록되므로 특정 월만 읽을 때는 해당 row group만 디코딩됩니다.
+        이미 저장된 월은 저장 파일에서 읽고, 없는 월만 바이낸스에서 수집합니다.
+
+        매개변수:
+            year: 연도 (이미 끝난 연도만 가능)
+            remove_monthly: True면 연 파일 저장 후 월 단위 Parquet 파일 삭제
+
+        반환값:
+            저장된 연 단위 Parquet 파일 경로
+        """
+        if year >= pd.Timestamp.now(tz='UTC').year:
+            raise ValueError(f"진행 중인 연도는 연 단위로 저장할 수 없습니다: {year}")
+
+        year_path = self.get_year_path(year)
+        tmp_path = year_path.with_name(f"{year_path.name}.tmp")
+        merged_paths = []
+        writer = None
+        completed = False
+
+        print(f"\n💾 {year}년 연 단위 Parquet 저장 중: {year_path}")
+        try:
+            for month in range(1, 13):
+                parquet_path, feather_path, _ = self.get_month_paths(year, month)
+                if parquet_path.exists() or feather_path.exists() or year_path.exists():
+                    df = self.load_month_data(year, month)
+                else:
+                    df = self.fetch_month_data(year, month)
+                if df is None or df.empty:
+                    continue
+
+                table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
+                if writer is None:
+                    writer = open_parquet_writer(tmp_path, table.schema)
+                else:
+                    # 예전 파일(timestamp[ns]/double)과 새로 수집한 월(timestamp[ms]/float32)이
+                    # 섞일 수 있으므로 첫 달의 스키마로 맞춤
+                    table = table.cast(writer.schema)
+                writer.write_table(table, row_group_size=len(table))
+
+                if parquet_path.exists():
+                    merged_paths.append(parquet_path)
+            completed = True
+        finally:
+            if writer is not None:
+                writer.close()
+            if not completed:
+                # 실패하면 쓰다 만 임시 파일 삭제
+                tmp_path.unlink(missing_ok=True)
+
+        if writer is None:
+            raise ValueError(f"{year}년 저장할 데이터 없음")
+
+        tmp_path.replace(year_path)
+        print(f"✓ {year}년 저장 완료 ({year_path.stat().st_size / (1024*1024):.2f} MB)")
+
+        if remove_monthly:
+            for path in merged_paths:
+                path.unlink()
+            print(f"✓ 월 단위 Parquet 파일 {len(merged_paths)}개 삭제")
+
+        return year_path
+
     def save_multiple_months(self, start_year: int, start_month: int,
                            end_year: int, end_month: int,
-                           save_csv: bool = True, save_parquet: bool = True):
+                           save_csv: bool = False, save_parquet: bool = True,
+                           save_feather: bool = True, save_dataset: bool = True,
+                           force: bool = False, max_workers: int = None):
         """
         여러 월 데이터 일괄 저장
 
+        월별 데이터는 서로 독립적이므로, 파일 인코딩/저장은 별도 프로세스에서 처리하고
+        그동안 메인 프로세스는 다음 달 데이터를 수집합니다.
+
         매개변수:
             start_year: 시작 연도
             start_month: 시작 월
             end_year: 종료 연도
             end_month: 종료 월
-            save_csv: CSV 저장 여부
+            save_csv: CSV 저장 여부 (기본: 저장 안 함)
             save_parquet: Parquet 저장 여부
+            save_feather: Feather 저장 여부
+            save_dataset: 파티셔닝 Parquet 데이터셋 저장 여부
+            force: True면 이미 저장된 월도 다시 수집
+            max_workers: 파일 저장 프로세스 수 (기본: CPU 코어 수의 절반)
         """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        dataset_dir = self.dataset_dir if save_dataset else None
+
+        # 저장 완료 후보 월은 manifest 조회 한 번으로 확인 (행 수를 알고 있으므로 메타데이터를 읽지 않음)
+        saved_months = {} if force else self.get_saved_months()
+
         current_date = datetime(start_year, start_month, 1)
         end_date = datetime(end_year, end_month, 1)
 
@@ -173,26 +698,65 @@ class MonthlyDataSaver:
         print(f"여러 월 저장 시작: {start_year}/{start_month} ~ {end_year}/{end_month}")
         print("🔄" * 40 + "\n")
 
-        while current_date <= end_date:
-            result = self.save_month_data(
-                current_date.year,
-                current_date.month,
-                save_csv=save_csv,
-                save_parquet=save_parquet
-            )
-
-            if result is not None:
-                success_count += 1
-            else:
-                fail_count += 1
-
-            # 다음 달로
-            if current_date.month == 12:
-                current_date = datetime(current_date.year + 1, 1, 1)
-            else:
-                current_date = datetime(current_date.year, current_date.month + 1, 1)
-
-            print("\n")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+
+            while current_date <= end_date:
+                year, month = current_date.year, current_date.month
+                paths = self.get_month_paths(year, month, save_csv, save_parquet, save_feather)
+
+                if (year, month) in saved_months:
+                    # 이번에 요청한 형식의 파일이 모두 남아 있어야 건너뜀 (삭제된 파일/새 형식은 다시 저장)
+                    targets = self._saved_targets(year, month, paths, save_dataset)
+                    is_saved = all(path.exists() for path in targets) and \
+                        self.is_month_complete(year, month, saved_months[(year, month)])
+                else:
+                    is_saved = not force and self.is_month_saved(
+                        year, month, self._saved_targets(year, month, paths, save_dataset))
+
+                if is_saved:
+                    print(f"⏭️  {year}년 {month}월 데이터 이미 저장됨 - 건너뜀")
+                    success_count += 1
+                else:
+                    try:
+                        # 다른 형식으로 저장된 지난 달은 저장 파일에서 빠진 형식만 생성
+                        local = None if force else self._load_for_missing_outputs(year, month, paths, save_dataset)
+                        if local is not None:
+                            print(f"📂 {year}년 {month}월 저장 파일에서 빠진 형식만 생성")
+                            df, write_paths, write_dataset_dir = local
+                        else:
+                            df = self.fetch_month_data(year, month)
+                            write_paths, write_dataset_dir = paths, dataset_dir
+                        if df is None:
+                            fail_count += 1
+                        else:
+                            # 저장은 작업 프로세스에 맡기고 바로 다음 달 수집 진행
+                            future = executor.submit(write_month_files, df, *write_paths,
+                                                     dataset_dir=write_dataset_dir)
+                            pending[future] = (year, month, len(df), paths)
+                    except Exception as e:
+                        print(f"\n❌ {year}년 {month}월 오류 발생: {e}")
+                        fail_count += 1
+
+                # 다음 달로
+                if current_date.month == 12:
+                    current_date = datetime(current_date.year + 1, 1, 1)
+                else:
+                    current_date = datetime(current_date.year, current_date.month + 1, 1)
+
+                print("\n")
+
+            # 남은 저장 작업 완료 대기
+            for future in as_completed(pending):
+                year, month, rows, paths = pending[future]
+                try:
+                    future.result()
+                    self.record_saved_month(year, month, rows, paths)
+                    print(f"🎉 {year}년 {month}월 데이터 저장 완료!")
+                    success_count += 1
+                except Exception as e:
+                    print(f"❌ {year}년 {month}월 저장 오류: {e}")
+                    fail_count += 1
 
         print("\n" + "=" * 80)
         print("📊 전체 작업 완료")
@@ -201,7 +765,6 @@ class MonthlyDataSaver:
         print(f"실패: {fail_count}개월")
         print(f"위치: {self.data_dir.absolute()}")
 
-
 def main():
     """메인 실행 함수"""
 
@@ -219,14 +782,14 @@ def main():
 
     # 예제: 2024년 12월 저장
     print("📌 2024년 12월 데이터 저장\n")
-    saver.save_month_data(year=2024, month=12, save_csv=True, save_parquet=True)
+    saver.save_month_data(year=2024, month=12, save_parquet=True, save_feather=True)
 
     # 여러 월 저장 예제 (주석 해제하여 사용)
     # print("\n📌 2024년 10~12월 저장\n")
     # saver.save_multiple_months(
     #     start_year=2024, start_month=10,
     #     end_year=2024, end_month=12,
-    #     save_csv=True, save_parquet=True
+    #     save_parquet=True, save_feather=True
     # )
 
 
@@ -5,7 +5,7 @@
 """
 
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 # 프로젝트 루트를 경로에 추가
@@ -30,7 +30,7 @@ def save_all_btc_history():
     print("📅 저장 기간: 2017년 8월 ~ 2025년 12월")
     print("💰 심볼: BTC/USDT")
     print("⏱️  타임프레임: 1분봉")
-    print("💾 저장 형식: CSV + Parquet")
+    print("💾 저장 형식: Parquet + Feather")
     print("")
     print("⚠️  주의: 전체 기간 데이터 수집에는 상당한 시간이 소요됩니다.")
     print("   (약 100개월 × 평균 43,000개 캔들 = 약 430만개 데이터)")
@@ -53,8 +53,8 @@ def save_all_btc_history():
     start_year = 2017
     start_month = 8
 
-    # 현재 날짜
-    now = datetime.now()
+    # 현재 날짜 (월 파일은 UTC 기준)
+    now = datetime.now(timezone.utc)
     end_year = now.year
     end_month = now.month
 
@@ -74,8 +74,8 @@ def save_all_btc_history():
         start_month=start_month,
         end_year=end_year,
         end_month=end_month,
-        save_csv=True,
-        save_parquet=True
+        save_parquet=True,
+        save_feather=True
     )
 
     # 소요 시간 계산
@@ -86,7 +86,7 @@ def save_all_btc_history():
     print("🎉 전체 데이터 저장 완료!")
     print("=" * 80)
     print(f"⏱️  소요 시간: {duration}")
-    print(f"📁 저장 위치: data/csv/ 및 data/parquet/")
+    print(f"📁 저장 위치: data/parquet/ 및 data/feather/")
     print("")
     print("💡 저장된 데이터 확인:")
     print("   python check_saved_data.py")
@@ -107,7 +107,7 @@ def save_recent_years(years: int = 1):
 
     saver = MonthlyDataSaver(symbol='BTC/USDT', timeframe='1m')
 
-    now = datetime.now()
+    now = datetime.now(timezone.utc)
     end_year = now.year
     end_month = now.month
 
@@ -128,8 +128,8 @@ def save_recent_years(years: int = 1):
         start_month=start_month,
         end_year=end_year,
         end_month=end_month,
-        save_csv=True,
-        save_parquet=True
+        save_parquet=True,
+        save_feather=True
     )
 
 
@@ -168,8 +168,8 @@ def main():
             start_month=start_month,
             end_year=end_year,
             end_month=end_month,
-            save_csv=True,
-            save_parquet=True
+            save_parquet=True,
+            save_feather=True
         )
     else:
         print("❌ 잘못된 선택")
@@ -82,12 +82,13 @@ def test_historical_data():
     print("=" * 80)
 
     try:
-        from datetime import datetime, timedelta
+        from datetime import datetime, timedelta, timezone
 
         # 최근 1시간
         collector = DataCollector(symbol='BTC/USDT', timeframe='1m')
 
-        end_date = datetime.now()
+        # 수집 날짜는 UTC 기준으로 해석되므로 현재 시각도 UTC로 계산
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(hours=1)
 
         print(f"\n기간: {start_date.strftime('%Y-%m-%d %H:%M')} ~ {end_date.strftime('%Y-%m-%d %H:%M')}")
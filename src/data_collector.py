@@ -4,11 +4,152 @@
 바이낸스 거래소 API를 사용하여 OHLCV 데이터(시가, 고가, 저가, 종가, 거래량)를 수집하고 검증합니다.
 """
 
+import asyncio
+import pickle
+import random
+import time
 import ccxt
+import ccxt.async_support as ccxt_async
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import time
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+try:
+    # orjson은 표준 json보다 3~5배 빠르게 kline 응답을 파싱
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# OHLCV 컬럼 순서 (ccxt 응답 순서와 동일)
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# 배치 재시도 최대 횟수 (네트워크 오류, 요청 제한 초과)
+MAX_RETRIES = 6
+
+# 요청 제한 초과 시 재시도 대기 상한 (초)
+RATE_LIMIT_MAX_DELAY = 30
+
+# 공유 HTTP 세션의 연결 풀 크기
+HTTP_POOL_SIZE = 20
+
+# 바이낸스 현물 API 호스트 (앞 호스트가 응답하지 않으면 다음 호스트로 전환)
+API_HOSTS = [
+    'https://api.binance.com',
+    'https://api1.binance.com',
+    'https://api2.binance.com',
+    'https://api3.binance.com'
+]
+
+# 바이낸스 현물 kline REST 엔드포인트 경로
+KLINES_PATH = '/api/v3/klines'
+
+# klines 요청 1회당 최대 캔들 수
+KLINES_LIMIT = 1000
+
+# ccxt rate limiter 기준 klines 요청 비용 (ccxt binance 현물 public klines 설정값)
+KLINES_RATE_LIMIT_COST = 0.4
+
+# 일 단위 캔들 캐시 기본 위치 (프로젝트 루트/.cache)
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / '.cache'
+
+# 하루 길이 (밀리초)
+DAY_MS = 86_400_000
+
+# 디스크에 저장한 거래소 마켓 정보 유효 시간 (초)
+MARKETS_CACHE_TTL = 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def get_exchange(default_type: str = 'spot') -> ccxt.binance:
+    """
+    시장 유형별로 공유되는 바이낸스 거래소 API 클라이언트 반환
+
+    처음 호출 시에만 생성하고 이후에는 같은 인스턴스를 재사용하므로
+    여러 DataCollector가 HTTP 연결과 거래소 메타데이터(load_markets)를 공유합니다.
+
+    매개변수:
+        default_type: 시장 유형 (기본값: 'spot' - 현물)
+
+    반환값:
+        ccxt 바이낸스 클라이언트
+    """
+    # 연결 풀을 사용하는 HTTP 세션 (TLS 연결을 요청마다 새로 맺지 않고 재사용)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip'})
+
+    return ccxt.binance({
+        'enableRateLimit': True,  # API 요청 제한 자동 처리
+        'options': {'defaultType': default_type},
+        'session': session  # 공유 HTTP 세션 사용
+    })
+
+
+class DayCache:
+    """
+    일 단위 OHLCV 디스크 캐시
+
+    지난 날짜의 캔들은 더 이상 바뀌지 않으므로 (심볼, 타임프레임, 날짜)별 Parquet 파일로 저장해 두고
+    다음 실행부터는 네트워크 요청 없이 읽습니다.
+    데이터가 없는 날(상장 전 등)도 빈 파일로 저장하여 다시 요청하지 않습니다.
+    저장 위치: {cache_dir}/{심볼}/{타임프레임}/{YYYY-MM-DD}.parquet
+    """
+
+    def __init__(self, cache_dir: Path, symbol: str, timeframe: str):
+        """
+        캐시 초기화
+
+        매개변수:
+            cache_dir: 캐시 루트 디렉토리
+            symbol: 거래 페어 심볼 (예: 'BTC/USDT')
+            timeframe: 캔들 타임프레임 (예: '1m')
+        """
+        self.cache_dir = Path(cache_dir) / symbol.replace('/', '_') / timeframe
+
+    def path(self, day: pd.Timestamp) -> Path:
+        """날짜별 캐시 파일 경로"""
+        return self.cache_dir / f"{day:%Y-%m-%d}.parquet"
+
+    def get(self, day: pd.Timestamp) -> Optional[pd.DataFrame]:
+        """
+        캐시된 날짜 데이터 반환
+
+        매개변수:
+            day: 날짜 (UTC 자정)
+
+        반환값:
+            캐시된 데이터프레임 (데이터 없는 날은 빈 데이터프레임), 캐시에 없으면 None
+        """
+        path = self.path(day)
+        if not path.exists():
+            return None
+        return pq.read_table(path).to_pandas()
+
+    def put(self, day: pd.Timestamp, df: pd.DataFrame):
+        """
+        날짜 데이터를 캐시에 저장 (완료된 날짜만 저장해야 함)
+
+        매개변수:
+            day: 날짜 (UTC 자정)
+            df: 해당 날짜의 OHLCV 데이터프레임
+        """
+        path = self.path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체 (중단되어도 불완전한 캐시 파일이 남지 않음)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path, compression='zstd')
+        tmp_path.replace(path)
 
 
 class DataCollector:
@@ -16,10 +157,19 @@ class DataCollector:
     바이낸스 데이터 수집기 클래스
 
     바이낸스 거래소에서 암호화폐 OHLCV 데이터를 수집하고 검증하는 기능을 제공합니다.
-    ccxt 라이브러리를 사용하여 API 통신을 처리합니다.
+    ccxt 라이브러리는 마켓 정보와 요청 제한 관리에 사용하고,
+    kline(OHLCV) 수집은 바이낸스 REST API를 직접 호출합니다.
     """
 
-    def __init__(self, symbol: str = 'BTC/USDT', timeframe: str = '1m'):
+    def __init__(
+        self,
+        symbol: str = 'BTC/USDT',
+        timeframe: str = '1m',
+        max_concurrency: int = 10,
+        precision: str = 'float32',
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None
+    ):
         """
         데이터 수집기 초기화
 
@@ -28,19 +178,92 @@ class DataCollector:
                    예: 'BTC/USDT', 'ETH/USDT', 'BNB/USDT'
             timeframe: 캔들 타임프레임 (기본값: '1m')
                       예: '1m', '5m', '15m', '1h', '1d'
+            max_concurrency: 과거 데이터 수집 시 동시 요청 수 (기본값: 10)
+            precision: OHLCV 가격/거래량 컬럼 자료형 (기본값: 'float32')
+                      메모리와 저장 용량을 절반으로 줄임. 전체 정밀도가 필요하면 'float64'
+            use_cache: 지난 날짜 데이터를 일 단위 디스크 캐시에서 재사용할지 여부 (기본값: True)
+            cache_dir: 캐시 디렉토리 (기본값: 프로젝트 루트/.cache)
 
         속성:
             self.symbol: 수집할 거래 페어
             self.timeframe: 캔들 시간 간격
-            self.exchange: 바이낸스 거래소 API 클라이언트
+            self.max_concurrency: 동시 요청 수
+            self.dtype: OHLCV 가격/거래량 컬럼 자료형
+            self.exchange: 바이낸스 거래소 API 클라이언트 (모든 수집기가 공유)
+            self.session: HTTP keep-alive 연결을 재사용하는 requests 세션
+            self.cache: 일 단위 디스크 캐시 (사용하지 않으면 None)
+            self.markets_cache_path: 마켓 정보 캐시 파일 경로 (사용하지 않으면 None)
         """
         self.symbol = symbol
         self.timeframe = timeframe
-        # 바이낸스 거래소 API 클라이언트 초기화
-        self.exchange = ccxt.binance({
-            'enableRateLimit': True,  # API 요청 제한 자동 처리
-            'options': {'defaultType': 'spot'}  # 현물 시장 사용
-        })
+        self.max_concurrency = max_concurrency
+
+        if precision not in ('float32', 'float64'):
+            raise ValueError(f"지원하지 않는 precision: {precision} ('float32' 또는 'float64')")
+        self.dtype = np.dtype(precision)
+
+        # 바이낸스 거래소 API 클라이언트 (현물 시장, 프로세스 내 공유)
+        self.exchange = get_exchange('spot')
+        self.session = self.exchange.session
+        # 마지막으로 정상 응답한 API 호스트 (API_HOSTS 인덱스)
+        self.host_index = 0
+
+        self.cache = None
+        self.markets_cache_path = None
+        if use_cache:
+            self.cache = DayCache(cache_dir or DEFAULT_CACHE_DIR, symbol, timeframe)
+            self.markets_cache_path = Path(cache_dir or DEFAULT_CACHE_DIR) / 'binance_markets.pkl'
+
+    def _ensure_markets_loaded(self) -> dict:
+        """
+        거래소 메타데이터(load_markets)를 한 번만 로드
+
+        공유 클라이언트에 이미 로드되어 있으면 네트워크 요청 없이 그대로 사용합니다.
+        디스크 캐시가 있으면 24시간 동안은 새 프로세스에서도 파일에서 읽어 load_markets 요청을 생략합니다.
+
+        반환값:
+            심볼별 마켓 정보 딕셔너리
+        """
+        if not self.exchange.markets:
+            cached = self._load_markets_cache()
+            if cached is not None:
+                self.exchange.set_markets(*cached)
+            else:
+                self.exchange.load_markets()
+                self._save_markets_cache()
+        return self.exchange.markets
+
+    def _load_markets_cache(self) -> Optional[tuple]:
+        """
+        디스크에 저장된 마켓 정보 읽기
+
+        반환값:
+            (마켓 정보, 통화 정보) 튜플 - 파일이 없거나 MARKETS_CACHE_TTL이 지났거나 읽을 수 없으면 None
+        """
+        path = self.markets_cache_path
+        if path is None or not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > MARKETS_CACHE_TTL:
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"마켓 정보 캐시 읽기 실패 (다시 요청합니다): {e}")
+            return None
+
+    def _save_markets_cache(self):
+        """로드한 마켓 정보를 디스크에 저장"""
+        path = self.markets_cache_path
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((list(self.exchange.markets.values()), self.exchange.currencies), f)
+        tmp_path.replace(path)
 
     def fetch_ohlcv(self, since: Optional[int] = None, limit: int = 1000) -> pd.DataFrame:
         """
@@ -55,38 +278,387 @@ class DataCollector:
             timestamp는 UTC 시간 (타임존 제거)
         """
         try:
-            # 바이낸스에서 OHLCV 데이터 요청
-            ohlcv = self.exchange.fetch_ohlcv(
-                self.symbol,
-                timeframe=self.timeframe,
-                since=since,
-                limit=limit
-            )
+            return self._to_dataframe(self._fetch_klines_raw(since=since, limit=limit), dtype=self.dtype)
 
-            # 데이터프레임으로 변환
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
+        except Exception as e:
+            print(f"데이터 수집 오류: {e}")
+            raise
 
-            # 타임스탬프를 UTC 시간으로 변환 (타임존 제거)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True).dt.tz_localize(None)
+    def _fetch_klines_raw(self, since: Optional[int] = None, limit: int = 1000,
+                          until: Optional[int] = None) -> np.ndarray:
+        """
+        바이낸스 klines REST 엔드포인트에서 OHLCV 원본 데이터 수집
 
-            return df
+        ccxt의 통합 파싱을 거치지 않고 공유 HTTP 세션으로 직접 요청한 뒤
+        orjson으로 파싱하여 바로 numpy 배열로 변환합니다.
+        ccxt는 마켓 정보(심볼 → 바이낸스 마켓 ID 변환)에만 사용합니다.
+        연결 실패나 서버 오류(5xx) 시 바이낸스 대체 호스트(api1~api3)로 전환하여 재요청합니다.
 
-        except Exception as e:
-            print(f"데이터 수집 오류: {e}")
+        매개변수:
+            since: 시작 시간 (밀리초 타임스탬프, None이면 최근 데이터)
+            limit: 수집할 캔들 개수 (최대 1000)
+            until: 종료 시간 (밀리초 타임스탬프, 포함)
+
+        반환값:
+            (N, 6) float64 배열 (timestamp, open, high, low, close, volume)
+        """
+        self._ensure_markets_loaded()
+        params = {
+            'symbol': self.exchange.market_id(self.symbol),
+            'interval': self.timeframe,
+            'limit': limit
+        }
+        if since is not None:
+            params['startTime'] = since
+        if until is not None:
+            params['endTime'] = until
+
+        response = self._get_klines(params)
+
+        # 418/429: 요청 가중치 제한 초과
+        if response.status_code in (418, 429):
+            raise ccxt.RateLimitExceeded(f"klines 요청 제한 초과 ({response.status_code})")
+        if response.status_code != 200:
+            raise ccxt.ExchangeError(f"klines 요청 오류 ({response.status_code}): {response.text}")
+
+        rows = json_loads(response.content)
+        if not rows:
+            return np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64)
+
+        # 앞 6개 필드(open time, open, high, low, close, volume)만 사용, 문자열 가격을 일괄 변환
+        return np.asarray(rows, dtype=object)[:, :len(OHLCV_COLUMNS)].astype(np.float64)
+
+    def _get_klines(self, params: dict) -> requests.Response:
+        """
+        klines 요청 (호스트 장애 시 다음 호스트로 전환)
+
+        마지막으로 정상 응답한 호스트부터 시도하고, 연결 실패나 5xx 응답이면
+        다음 호스트로 넘어갑니다.
+
+        매개변수:
+            params: klines 쿼리 파라미터
+
+        반환값:
+            5xx가 아닌 응답
+        """
+        start = self.host_index
+        error = None
+        for offset in range(len(API_HOSTS)):
+            index = (start + offset) % len(API_HOSTS)
+            try:
+                response = self.session.get(API_HOSTS[index] + KLINES_PATH, params=params, timeout=10)
+            except requests.RequestException as e:
+                error = ccxt.NetworkError(f"klines 요청 실패 ({API_HOSTS[index]}): {e}")
+                continue
+            if response.status_code >= 500:
+                error = ccxt.ExchangeNotAvailable(f"바이낸스 서버 오류 ({response.status_code})")
+                continue
+
+            self.host_index = index
+            return response
+
+        raise error
+
+    @staticmethod
+    def _to_array(df: pd.DataFrame) -> np.ndarray:
+        """
+        OHLCV 데이터프레임을 (N, 6) float64 원본 배열로 변환 (_to_dataframe의 역변환)
+
+        매개변수:
+            df: OHLCV 데이터프레임
+
+        반환값:
+            (N, 6) float64 배열 (timestamp는 밀리초)
+        """
+        arr = np.empty((len(df), len(OHLCV_COLUMNS)), dtype=np.float64)
+        arr[:, 0] = df['timestamp'].to_numpy(dtype='datetime64[ms]').astype(np.int64)
+        arr[:, 1:] = df[OHLCV_COLUMNS[1:]].to_numpy(dtype=np.float64)
+        return arr
+
+    @staticmethod
+    def _to_dataframe(ohlcv, dtype: np.dtype = np.float64) -> pd.DataFrame:
+        """
+        OHLCV 원본 데이터를 데이터프레임으로 변환
+
+        매개변수:
+            ohlcv: [timestamp, open, high, low, close, volume] 리스트의 리스트 또는 (N, 6) 배열
+            dtype: 가격/거래량 컬럼 자료형 (timestamp는 항상 datetime64)
+
+        반환값:
+            OHLCV 데이터프레임 (timestamp는 타임존 없는 UTC 시간)
+        """
+        arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+
+        # 컬럼별 배열로 한 번에 생성
+        # 타임스탬프는 int64 밀리초를 datetime64[ms]로 재해석 (파싱/단위 변환 없이 타임존 없는 UTC 시간)
+        data = {'timestamp': arr[:, 0].astype(np.int64).view('datetime64[ms]')}
+        for i, col in enumerate(OHLCV_COLUMNS[1:], 1):
+            data[col] = arr[:, i].astype(dtype)
+
+        return pd.DataFrame(data)
+
+    async def _fetch_batches_async(
+        self,
+        windows: List[Tuple[int, int]],
+        limit: int,
+        out: np.ndarray,
+        on_batch: Optional[Callable[[int, np.ndarray, np.ndarray], Optional[Awaitable]]] = None
+    ) -> np.ndarray:
+        """
+        여러 배치를 비동기로 동시에 수집
+
+        asyncio.Semaphore로 동시 요청 수를 제한하고, 요청 간격은 ccxt의 rate limiter가
+        바이낸스 요청 가중치 제한 내에서 조절합니다.
+        실제 요청은 공유 HTTP 세션을 사용하는 _fetch_klines_raw를 스레드에서 실행합니다.
+        네트워크 오류나 요청 제한 초과 시 지수 백오프로 재시도합니다.
+        각 배치 결과는 미리 할당된 out 버퍼의 해당 칸에 바로 복사됩니다.
+
+        매개변수:
+            windows: 각 배치의 (시작, 종료) 시간 (밀리초 타임스탬프, 종료 포함) 리스트
+            limit: 배치당 캔들 개수
+            out: 결과를 채울 (배치 수, limit, 6) 크기의 버퍼
+            on_batch: 배치가 버퍼에 저장될 때마다 (배치 인덱스, out, 행 수 배열)로 호출할 함수
+                      awaitable을 반환하면 (예: 파일 저장) 남은 배치 수집과 동시에 실행
+
+        반환값:
+            배치별로 채워진 행 수 배열
+        """
+        # 비동기 클라이언트는 요청 가중치 제한(rate limiter) 관리에 사용
+        exchange = ccxt_async.binance({
+            'enableRateLimit': True,  # API 요청 제한 자동 처리
+            'options': {'defaultType': 'spot'}  # 현물 시장 사용
+        })
+        # 공유 클라이언트에 캐시된 마켓 정보를 재사용 (실행마다 load_markets 요청 방지)
+        exchange.set_markets(self._ensure_markets_loaded(), self.exchange.currencies)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        total = len(windows)
+        completed = 0
+        counts = np.zeros(total, dtype=np.int64)
+        background = []
+
+        async def fetch_batch(index: int, since: int, until: int):
+            nonlocal completed
+            async with semaphore:
+                for attempt in range(MAX_RETRIES):
+                    try:
+                        await exchange.throttle(KLINES_RATE_LIMIT_COST)
+                        # 배치 구간 끝(until)을 지정하여 다음 배치와 겹치지 않도록 함
+                        ohlcv = await asyncio.to_thread(self._fetch_klines_raw, since, limit, until)
+                        break
+                    except ccxt.RateLimitExceeded as e:
+                        # 요청 제한은 가중치가 회복될 때까지 기다림 (상한 있음)
+                        if attempt == MAX_RETRIES - 1:
+                            raise
+                        delay = min(2 ** attempt, RATE_LIMIT_MAX_DELAY)
+                        print(f"요청 제한 초과 (since={since}): {e} - {delay}초 후 재시도")
+                        await asyncio.sleep(delay)
+                    except ccxt.NetworkError as e:
+                        # 동시 재시도가 한꺼번에 몰리지 않도록 지터 추가
+                        if attempt == MAX_RETRIES - 1:
+                            raise
+                        delay = 0.5 * 2 ** attempt + random.random()
+                        print(f"배치 오류 (since={since}): {e} - {delay:.1f}초 후 재시도")
+                        await asyncio.sleep(delay)
+
+            # 배치 칸에 바로 복사 (응답 배열은 여기서 해제됨)
+            rows = min(len(ohlcv), limit)
+            out[index, :rows] = ohlcv[:rows]
+            counts[index] = rows
+
+            if on_batch is not None:
+                pending = on_batch(index, out, counts)
+                if pending is not None:
+                    background.append(asyncio.ensure_future(pending))
+
+            completed += 1
+            # 진행 상황 출력
+            if completed % 10 == 0 or completed == total:
+                print(f"{completed}/{total}개 배치 완료")
+
+        tasks = [asyncio.create_task(fetch_batch(i, since, until)) for i, (since, until) in enumerate(windows)]
+        try:
+            await asyncio.gather(*tasks)
+            # 수집 중 시작된 백그라운드 작업 완료 대기
+            await asyncio.gather(*background)
+            return counts
+        except BaseException:
+            # 한 배치가 최종 실패하면 남은 배치 요청을 취소한 뒤 클라이언트 종료
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *background, return_exceptions=True)
             raise
+        finally:
+            await exchange.close()
+
+    def _split_windows(self, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        시간 구간들을 KLINES_LIMIT개 캔들 단위의 독립 배치 구간으로 분할
+
+        매개변수:
+            ranges: (시작, 끝) 밀리초 타임스탬프 리스트 (끝은 포함하지 않음, 시간순)
+
+        반환값:
+            (시작, 종료) 배치 구간 리스트 (종료 포함, 구간 경계를 넘지 않음)
+        """
+        window_ms = int(self.exchange.parse_timeframe(self.timeframe) * 1000) * KLINES_LIMIT
+        return [
+            (since, min(since + window_ms, end) - 1)
+            for start, end in ranges
+            for since in range(start, end, window_ms)
+        ]
+
+    async def _fetch_windows_raw_async(self, windows: List[Tuple[int, int]], on_batch=None) -> np.ndarray:
+        """
+        배치 구간들의 OHLCV 원본 데이터를 동시에 수집
+
+        매개변수:
+            windows: _split_windows로 분할한 배치 구간 리스트
+            on_batch: 배치 완료 시 호출할 함수 (_fetch_batches_async 참고)
+
+        반환값:
+            배치 순서대로 이어 붙인 (N, 6) float64 배열
+        """
+        limit = KLINES_LIMIT
+        if not windows:
+            return np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64)
+
+        # 배치마다 최대 limit개이므로 전체 크기를 미리 할당하고 배치별 칸에 채움
+        buf = np.empty((len(windows), limit, 6), dtype=np.float64)
+
+        # 모든 배치를 동시에 수집 (배치 i는 buf[i]에 저장되어 순서 유지)
+        counts = await self._fetch_batches_async(windows, limit, buf, on_batch)
+
+        # 배치별로 채워진 행만 모아서 (행 수, 6) 배열로 압축 (복사 한 번)
+        return buf[np.arange(limit) < counts[:, None]]
+
+    def _cache_day(self, day_ts: int, out: np.ndarray, counts: np.ndarray, first: int, last: int):
+        """
+        버퍼에서 하루치 데이터를 꺼내 캐시에 저장 (수집 중 백그라운드 스레드에서 실행)
+
+        매개변수:
+            day_ts: 날짜 (UTC 자정, 밀리초 타임스탬프)
+            out: 배치 버퍼
+            counts: 배치별 행 수
+            first, last: 해당 날짜와 겹치는 배치 인덱스 범위 [first, last)
+        """
+        rows = np.concatenate([out[i, :counts[i]] for i in range(first, last)])
+        ts = rows[:, 0]
+        rows = rows[(ts >= day_ts) & (ts < day_ts + DAY_MS)]
+        self.cache.put(pd.Timestamp(day_ts, unit='ms'), self._to_dataframe(rows, dtype=np.float64))
+
+    async def _fetch_range_cached_async(self, start_ts: int, end_ts: int) -> np.ndarray:
+        """
+        일 단위 캐시를 사용하여 구간 데이터 수집
+
+        캐시에 있는 지난 날짜는 파일에서 읽고, 없는 날짜(와 진행 중인 오늘)만 바이낸스에서 수집합니다.
+        새로 수집한 지난 날짜는 데이터가 없는 날까지 포함해 캐시에 저장하며,
+        하루치 배치가 모두 도착하는 즉시 백그라운드 스레드에서 저장하여 남은 수집과 겹쳐 실행합니다.
+
+        매개변수:
+            start_ts: 시작 시간 (밀리초 타임스탬프, UTC 자정)
+            end_ts: 종료 시간 (밀리초 타임스탬프, 포함)
+
+        반환값:
+            날짜 순서대로 이어 붙인 (N, 6) float64 배열
+        """
+        # 오늘(UTC) 자정 - 이전 날짜만 완료된 데이터로 캐시
+        today_ts = pd.Timestamp.now(tz='UTC').floor('D').value // 1_000_000
+
+        days = list(range(start_ts, end_ts + 1, DAY_MS))
+        day_arrays = {}
+        missing = []
+        for day_ts in days:
+            cached = self.cache.get(pd.Timestamp(day_ts, unit='ms')) if day_ts < today_ts else None
+            if cached is None:
+                missing.append(day_ts)
+            else:
+                day_arrays[day_ts] = self._to_array(cached)
+
+        if missing:
+            print(f"캐시: {len(days) - len(missing)}일 사용, {len(missing)}일 수집")
+
+            # 연속된 누락 날짜를 하나의 구간으로 묶어서 요청 수 최소화
+            ranges = []
+            for day_ts in missing:
+                if ranges and ranges[-1][1] == day_ts:
+                    ranges[-1][1] = day_ts + DAY_MS
+                else:
+                    ranges.append([day_ts, day_ts + DAY_MS])
+            ranges[-1][1] = min(ranges[-1][1], end_ts + 1)
+            windows = self._split_windows([tuple(r) for r in ranges])
+
+            # 캐시할 날짜(완료된 날)마다 겹치는 배치 인덱스 범위 [first, last)
+            cache_days = np.array([d for d in missing if d + DAY_MS <= min(today_ts, end_ts + 1)], dtype=np.int64)
+            starts = np.array([since for since, _ in windows], dtype=np.int64)
+            ends = np.array([until for _, until in windows], dtype=np.int64)
+            day_first = np.searchsorted(ends, cache_days, side='left')
+            day_last = np.searchsorted(starts, cache_days + DAY_MS, side='left')
+            remaining = day_last - day_first
+            window_days = [[] for _ in windows]
+            for k in range(len(cache_days)):
+                for i in range(day_first[k], day_last[k]):
+                    window_days[i].append(k)
+
+            def on_batch(index: int, out: np.ndarray, counts: np.ndarray):
+                # 하루치 배치가 모두 도착한 날짜는 바로 캐시에 저장
+                writes = []
+                for k in window_days[index]:
+                    remaining[k] -= 1
+                    if remaining[k] == 0:
+                        writes.append(asyncio.to_thread(
+                            self._cache_day, int(cache_days[k]), out, counts, day_first[k], day_last[k]
+                        ))
+                return asyncio.gather(*writes) if writes else None
+
+            fetched = await self._fetch_windows_raw_async(windows, on_batch)
+
+            # 날짜별로 분리 (배치 구간이 겹치지 않으므로 이미 시간순)
+            ts = fetched[:, 0].astype(np.int64)
+            bounds = np.searchsorted(ts, np.array(missing + [missing[-1] + DAY_MS]))
+            for i, day_ts in enumerate(missing):
+                day_arrays[day_ts] = fetched[bounds[i]:bounds[i + 1]]
+
+        return np.concatenate([day_arrays[day_ts] for day_ts in days])
 
     def fetch_all_historical_data(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        과거 데이터 전체 수집 (동기 버전)
+
+        이벤트 루프가 이미 실행 중인 환경(Jupyter, 비동기 코드)에서 호출하면
+        별도 스레드의 새 이벤트 루프에서 수집합니다. 비동기 코드에서는
+        fetch_all_historical_data_async를 직접 await하는 것이 좋습니다.
+
+        매개변수:
+            start_date: 시작 날짜 ('YYYY-MM-DD')
+            end_date: 종료 날짜 ('YYYY-MM-DD') - 해당 날짜 23:59:59까지 포함
+
+        반환값:
+            전체 OHLCV 데이터프레임
+        """
+        coro = self.fetch_all_historical_data_async(start_date, end_date)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # 실행 중인 루프 안에서는 asyncio.run을 쓸 수 없으므로 별도 스레드에서 실행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def fetch_all_historical_data_async(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
     ) -> pd.DataFrame:
         """
         과거 데이터 전체 수집
 
         바이낸스 API 제한(1회 최대 1000개)으로 인해 배치 단위로 나누어 수집합니다.
+        종료 시간을 미리 알 수 있으므로 전체 구간을 배치로 분할한 뒤 동시에 요청합니다.
 
         매개변수:
             start_date: 시작 날짜 ('YYYY-MM-DD')
@@ -101,76 +673,44 @@ class DataCollector:
         if end_date is None:
             end_date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
-        # 날짜를 밀리초 단위 타임스탬프로 변환
+        # 날짜를 밀리초 단위 타임스탬프로 변환 (UTC 기준)
         # 시작: 해당 날짜 00:00:00
-        start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp() * 1000)
+        start_ts = pd.Timestamp(start_date, tz='UTC').value // 1_000_000
 
-        # 종료: 해당 날짜 23:59:59 (해당 날짜 전체 포함)
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-        end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-        end_ts = int(end_dt.timestamp() * 1000)
+        # 종료: 해당 날짜 23:59:59.999 (해당 날짜 전체 포함)
+        end_ts = (pd.Timestamp(end_date, tz='UTC') + pd.Timedelta(days=1)).value // 1_000_000 - 1
 
         print(f"데이터 수집 시작: {start_date} ~ {end_date}")
         print(f"심볼: {self.symbol}, 타임프레임: {self.timeframe}")
 
-        all_data = []
-        current_ts = start_ts
-        batch_count = 0
-
-        # 배치 단위로 데이터 수집 (한 번에 최대 1000개)
-        while current_ts < end_ts:
-            try:
-                # 1000개 캔들 수집
-                df = self.fetch_ohlcv(since=current_ts, limit=1000)
-
-                if df.empty:
-                    print("더 이상 데이터 없음")
-                    break
+        if self.cache is None:
+            arr = await self._fetch_windows_raw_async(self._split_windows([(start_ts, end_ts + 1)]))
+        else:
+            arr = await self._fetch_range_cached_async(start_ts, end_ts)
 
-                all_data.append(df)
-                batch_count += 1
-
-                # 다음 배치 타임스탬프 계산
-                last_timestamp = df['timestamp'].iloc[-1]
-                current_ts = int(last_timestamp.timestamp() * 1000) + 60000  # +1분
-
-                # 진행 상황 출력
-                if batch_count % 10 == 0:
-                    print(f"{batch_count}개 배치 완료, 마지막: {last_timestamp}")
-
-                # API 요청 제한 방지
-                time.sleep(0.5)
-
-                # 종료 시간 도달 확인
-                if current_ts >= end_ts:
-                    break
-
-            except Exception as e:
-                print(f"배치 {batch_count} 오류: {e}")
-                time.sleep(2)
-                continue
-
-        if not all_data:
+        if not len(arr):
             raise ValueError("수집된 데이터 없음")
 
-        # 모든 배치 결합
-        combined_df = pd.concat(all_data, ignore_index=True)
+        # 타임스탬프는 int64로 비교 (float 비교/정렬 대신 정수 연산)
+        ts = arr[:, 0].astype(np.int64)
+
+        # 배치 구간이 겹치지 않으므로 보통 이미 정렬되어 있음 - 순서가 어긋난 경우에만 중복 제거 및 정렬
+        if not (np.diff(ts) > 0).all():
+            ts, unique_idx = np.unique(ts, return_index=True)
+            arr = arr[unique_idx]
 
-        # 중복 제거 및 정렬
-        combined_df = combined_df.drop_duplicates(subset=['timestamp'])
-        combined_df = combined_df.sort_values('timestamp').reset_index(drop=True)
+        # 종료 날짜 이후 데이터 제거 (end_date 23:59:59까지만 포함, 이진 탐색)
+        cut = np.searchsorted(ts, end_ts, side='right')
 
-        # 종료 날짜 이후 데이터 제거 (end_date 23:59:59까지만 포함)
-        end_datetime = datetime.strptime(end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59)
-        combined_df = combined_df[combined_df['timestamp'] <= end_datetime]
-        combined_df = combined_df.reset_index(drop=True)
+        # 데이터프레임은 마지막에 한 번만 생성
+        combined_df = self._to_dataframe(arr[:cut], dtype=self.dtype)
 
         print(f"\n총 {len(combined_df):,}개 캔들 수집 완료")
         print(f"기간: {combined_df['timestamp'].min()} ~ {combined_df['timestamp'].max()}")
 
         return combined_df
 
-    def validate_data(self, df: pd.DataFrame) -> bool:
+    def validate_data(self, df: pd.DataFrame, null_counts: Optional[dict] = None) -> bool:
         """
         데이터 유효성 검증
 
@@ -180,10 +720,11 @@ class DataCollector:
             3. NULL 값 확인
             4. 가격 데이터 범위 확인 (양수)
             5. OHLC 논리 확인 (고가 >= 저가 등)
-            6. 중복 타임스탬프 확인
+            6. 타임스탬프 정렬 및 중복 확인
 
         매개변수:
             df: 검증할 데이터프레임
+            null_counts: 컬럼별 NULL 개수를 받을 딕셔너리 (선택, 요약 출력 시 재사용)
 
         반환값:
             유효하면 True, 아니면 False
@@ -199,30 +740,49 @@ class DataCollector:
             print(f"검증 실패: 필수 컬럼 누락")
             return False
 
-        # NULL 값 확인
-        null_counts = df[required_columns].isnull().sum()
-        if null_counts.any():
-            print(f"검증 경고: NULL 값 발견\n{null_counts[null_counts > 0]}")
+        # 숫자 컬럼을 한 번만 numpy 배열로 추출 (open, high, low, close, volume)
+        values = df[required_columns[1:]].to_numpy(dtype=np.float64)
 
-        # 가격 양수 확인
+        # NULL 값 확인
+        column_nulls = pd.Series(
+            np.concatenate([[df['timestamp'].isna().sum()], np.isnan(values).sum(axis=0)]),
+            index=required_columns
+        )
+        if null_counts is not None:
+            null_counts.update({col: int(count) for col, count in column_nulls.items()})
+        if column_nulls.any():
+            print(f"검증 경고: NULL 값 발견\n{column_nulls[column_nulls > 0]}")
+
+        # 가격 양수 확인 (open, high, low, close를 한 번에 검사)
         price_columns = ['open', 'high', 'low', 'close']
-        for col in price_columns:
-            if (df[col] <= 0).any():
-                print(f"검증 실패: {col}에 0 이하 값 존재")
-                return False
+        prices = values[:, :4]
+        non_positive = (prices <= 0).any(axis=0)
+        if non_positive.any():
+            col = price_columns[int(np.argmax(non_positive))]
+            print(f"검증 실패: {col}에 0 이하 값 존재")
+            return False
 
         # OHLC 논리 검증
-        invalid_high = (df['high'] < df['low']) | (df['high'] < df['open']) | (df['high'] < df['close'])
-        invalid_low = (df['low'] > df['open']) | (df['low'] > df['close'])
+        # 고가는 시가/저가/종가 이상, 저가는 시가/종가 이하여야 함 (NaN 비교는 False이므로 무시됨)
+        # 모든 조건을 하나의 불리언 배열로 합쳐서 캔들 단위로 한 번만 집계
+        o, h, l, c = prices.T
+        invalid = (h < l) | (h < o) | (h < c) | (l > o) | (l > c)
 
-        if invalid_high.any() or invalid_low.any():
-            total_invalid = invalid_high.sum() + invalid_low.sum()
+        total_invalid = int(invalid.sum())
+        if total_invalid > 0:
             print(f"검증 경고: {total_invalid}개 캔들에서 OHLC 오류")
 
-        # 중복 타임스탬프 확인
-        duplicates = df.duplicated(subset=['timestamp']).sum()
-        if duplicates > 0:
-            print(f"검증 경고: {duplicates}개 중복 타임스탬프")
+        # 타임스탬프 정렬 및 중복 확인 (int64 배열의 인접 값 비교 한 번으로 검사)
+        # 수집 결과는 항상 엄격히 증가하므로 보통 여기서 끝남
+        ts = df['timestamp'].to_numpy().view('i8')
+        steps = np.diff(ts)
+        if not (steps > 0).all():
+            if (steps < 0).any():
+                print("검증 경고: 타임스탬프가 시간순으로 정렬되어 있지 않음")
+                steps = np.diff(np.sort(ts))
+            duplicates = int((steps == 0).sum())
+            if duplicates > 0:
+                print(f"검증 경고: {duplicates}개 중복 타임스탬프")
 
         print("검증 완료: 데이터 정상")
         return True
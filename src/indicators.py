@@ -7,8 +7,233 @@ EMA, MACD, RSI, 볼린저 밴드 등의 주요 지표를 제공합니다.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
+try:
+    # numba가 있으면 지표 계산 루프를 기계어로 컴파일하여 사용 (nogil: 스레드 병렬 실행 가능)
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba가 없을 때 사용하는 대체 데코레이터 (pandas 구현으로 계산)"""
+        return lambda func: func
+
+try:
+    # TA-Lib(C 구현)이 있으면 이동 평균/표준편차 계산에 사용
+    import talib
+except ImportError:
+    talib = None
+
+# 컴파일 결과 디스크 캐시는 패키지로 임포트된 경우(src.indicators)에만 사용
+# 캐시에 임포트 당시 모듈 이름이 기록되므로, 다른 이름(indicators)으로 만든 캐시를
+# 읽으면 numba가 ModuleNotFoundError를 냄
+JIT_CACHE = bool(__package__)
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _ema_kernel(data: np.ndarray, alphas: np.ndarray, out: np.ndarray):
+    """
+    여러 기간의 EMA를 한 번의 순회로 계산
+
+    각 값을 한 번만 읽어서 모든 기간의 EMA를 함께 갱신합니다.
+    pandas ewm(adjust=False)과 같은 방식으로 NaN 구간을 처리합니다.
+
+    매개변수:
+        data: float64 가격 배열
+        alphas: 기간별 평활 계수 2 / (period + 1) 배열
+        out: 결과를 채울 (기간 수, len(data)) 배열
+    """
+    for k in range(len(alphas)):
+        alpha = alphas[k]
+        weighted = data[0]
+        old_weight = 1.0
+        out[k, 0] = weighted
+
+        for i in range(1, len(data)):
+            value = data[i]
+            is_observed = value == value
+            if weighted == weighted:
+                # NaN 구간 동안 이전 값의 가중치를 계속 감소시킴
+                old_weight *= 1.0 - alpha
+                if is_observed:
+                    weighted = (old_weight * weighted + alpha * value) / (old_weight + alpha)
+                    old_weight = 1.0
+            elif is_observed:
+                weighted = value
+            out[k, i] = weighted
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _rsi_kernel(close: np.ndarray, period: int, out: np.ndarray):
+    """
+    RSI 계산 루프 (종가 배열을 한 번만 순회)
+
+    평균 상승분/하락분을 스칼라로 유지하며 갱신하므로 중간 배열을 만들지 않습니다.
+    pandas 구현(ewm(span=period, adjust=False))과 같은 평활 계수 2 / (period + 1)을 사용합니다.
+
+    매개변수:
+        close: float64 종가 배열
+        period: RSI 계산 기간
+        out: 결과를 채울 배열 (close와 같은 길이)
+    """
+    alpha = 2.0 / (period + 1)
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(len(close)):
+        gain = 0.0
+        loss = 0.0
+        if i > 0:
+            diff = close[i] - close[i - 1]
+            # NaN 변화량은 상승/하락 모두 0으로 처리 (pandas where와 동일)
+            if diff > 0:
+                gain = diff
+            elif diff < 0:
+                loss = -diff
+            avg_gain = avg_gain + alpha * (gain - avg_gain)
+            avg_loss = avg_loss + alpha * (loss - avg_loss)
+
+        out[i] = _rsi_value(avg_gain, avg_loss)
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    """평균 상승분/하락분으로 RSI 값 계산"""
+    if avg_loss == 0.0:
+        # 하락이 없으면 RSI 100, 변화가 전혀 없으면 정의되지 않음
+        return np.nan if avg_gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _bollinger_step(data: np.ndarray, i: int, period: int, state: np.ndarray):
+    """
+    i번째 값에서 끝나는 이동 창의 평균/표준편차 갱신 (i = 0부터 순서대로 호출)
+
+    창에 들어오는 값과 빠지는 값만으로 평균과 편차 제곱합을 갱신하는 Welford 방식이라
+    창 크기와 무관하게 값마다 일정한 연산만 수행하며, 큰 가격에서도 합/제곱합 방식보다 오차가 작습니다.
+
+    매개변수:
+        data: float64 가격 배열 (NaN 없음)
+        i: 현재 위치
+        period: 이동 평균 기간 (2 이상)
+        state: [평균, 편차 제곱합, 같은 값 연속 개수] 상태 배열 (0으로 초기화해서 전달)
+
+    반환값:
+        (평균, 표본표준편차) - 창이 채워지기 전에는 NaN
+    """
+    # 같은 값이 연속된 개수 (창 전체가 같은 값이면 표준편차를 정확히 0으로)
+    if i > 0 and data[i] == data[i - 1]:
+        state[2] += 1
+    else:
+        state[2] = 1
+    if i < period - 1:
+        return np.nan, np.nan
+
+    if (i - period + 1) % 4096 == 0:
+        # 첫 창, 그리고 4096개마다 창 전체로 다시 계산하여 누적 오차 제거
+        mean = 0.0
+        m2 = 0.0
+        for j in range(period):
+            value = data[i - period + 1 + j]
+            delta = value - mean
+            mean += delta / (j + 1)
+            m2 += delta * (value - mean)
+    else:
+        # 창 이동: data[i]가 들어오고 data[i - period]가 빠짐
+        new = data[i]
+        old = data[i - period]
+        mean = state[0] + (new - old) / period
+        m2 = state[1] + (new - old) * (new - mean + old - state[0])
+
+    if state[2] >= period:
+        mean = data[i]
+        m2 = 0.0
+
+    state[0] = mean
+    state[1] = m2
+
+    # 표본표준편차 (pandas rolling std와 같은 ddof=1)
+    return mean, np.sqrt(max(m2, 0.0) / (period - 1))
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _bollinger_kernel(data: np.ndarray, period: int, std_dev: float,
+                      upper: np.ndarray, middle: np.ndarray, lower: np.ndarray):
+    """
+    볼린저 밴드 계산 루프 (이동 창의 평균/분산을 O(1)로 갱신)
+
+    매개변수:
+        data: float64 가격 배열 (NaN 없음)
+        period: 이동 평균 기간 (2 이상)
+        std_dev: 표준편차 배수
+        upper, middle, lower: 결과를 채울 배열 (data와 같은 길이)
+    """
+    state = np.zeros(3)
+    for i in range(len(data)):
+        mean, std = _bollinger_step(data, i, period, state)
+        middle[i] = mean
+        upper[i] = mean + std * std_dev
+        lower[i] = mean - std * std_dev
+
+
+@njit(cache=JIT_CACHE, nogil=True)
+def _all_indicators_kernel(close: np.ndarray, ema_alphas: np.ndarray, signal_alpha: float,
+                           rsi_alpha: float, bb_period: int, bb_std_dev: float, out: np.ndarray):
+    """
+    모든 지표를 종가 한 번 순회로 계산
+
+    EMA, MACD, RSI, 볼린저 밴드의 상태를 모두 스칼라로 유지하며 값마다 한 번에 갱신하므로
+    종가 배열을 지표 수만큼 반복해서 읽지 않습니다.
+
+    매개변수:
+        close: float64 종가 배열 (NaN 없음)
+        ema_alphas: EMA 평활 계수 배열 (앞의 두 개가 MACD의 빠른/느린 EMA)
+        signal_alpha: MACD 시그널 라인 평활 계수
+        rsi_alpha: RSI 평활 계수
+        bb_period: 볼린저 밴드 기간 (2 이상)
+        bb_std_dev: 볼린저 밴드 표준편차 배수
+        out: 결과를 채울 (EMA 수 + 7, len(close)) 배열
+             행 순서: EMA들, macd, macd_signal, macd_histogram, rsi, bb_upper, bb_middle, bb_lower
+    """
+    n_ema = len(ema_alphas)
+    emas = np.empty(n_ema)
+    bb_state = np.zeros(3)
+    signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(len(close)):
+        value = close[i]
+
+        # EMA
+        for k in range(n_ema):
+            emas[k] = value if i == 0 else emas[k] + ema_alphas[k] * (value - emas[k])
+            out[k, i] = emas[k]
+
+        # MACD
+        macd = emas[0] - emas[1]
+        signal = macd if i == 0 else signal + signal_alpha * (macd - signal)
+        out[n_ema, i] = macd
+        out[n_ema + 1, i] = signal
+        out[n_ema + 2, i] = macd - signal
+
+        # RSI
+        if i > 0:
+            diff = value - close[i - 1]
+            avg_gain += rsi_alpha * (max(diff, 0.0) - avg_gain)
+            avg_loss += rsi_alpha * (max(-diff, 0.0) - avg_loss)
+        out[n_ema + 3, i] = _rsi_value(avg_gain, avg_loss)
+
+        # 볼린저 밴드
+        mean, std = _bollinger_step(close, i, bb_period, bb_state)
+        out[n_ema + 4, i] = mean + std * bb_std_dev
+        out[n_ema + 5, i] = mean
+        out[n_ema + 6, i] = mean - std * bb_std_dev
+
 
 class TechnicalIndicators:
     """
@@ -24,6 +249,59 @@ class TechnicalIndicators:
         - 볼린저 밴드: 가격의 변동성 측정
     """
 
+    # add_all_indicators에서 계산하는 EMA 기간
+    EMA_PERIODS = (12, 26, 50, 200)
+
+    # add_all_indicators가 추가하는 지표 컬럼
+    INDICATOR_COLUMNS = [
+        'ema_12', 'ema_26', 'ema_50', 'ema_200',
+        'macd', 'macd_signal', 'macd_histogram',
+        'rsi',
+        'bb_upper', 'bb_middle', 'bb_lower'
+    ]
+
+    @staticmethod
+    def _ema_matrix(values: np.ndarray, periods) -> np.ndarray:
+        """
+        여러 기간의 EMA를 한 번에 계산
+
+        매개변수:
+            values: 가격 배열
+            periods: EMA 기간 리스트
+
+        반환값:
+            (기간 수, len(values)) float64 배열
+        """
+        if NUMBA_AVAILABLE:
+            alphas = 2.0 / (np.asarray(periods, dtype=np.float64) + 1.0)
+            out = np.empty((len(periods), len(values)), dtype=np.float64)
+            _ema_kernel(np.asarray(values, dtype=np.float64), alphas, out)
+            return out
+
+        series = pd.Series(values, dtype=np.float64)
+        return np.vstack([series.ewm(span=period, adjust=False).mean().to_numpy() for period in periods])
+
+    @staticmethod
+    def _macd_from_emas(fast_ema: np.ndarray, slow_ema: np.ndarray,
+                        signal_period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        빠른/느린 EMA 배열로 MACD 라인, 시그널 라인, 히스토그램 계산
+
+        매개변수:
+            fast_ema: 빠른 EMA 배열
+            slow_ema: 느린 EMA 배열
+            signal_period: 시그널 라인 EMA 기간
+
+        반환값:
+            (MACD 라인, 시그널 라인, MACD 히스토그램) 배열 튜플
+        """
+        # MACD 라인 = 빠른 EMA - 느린 EMA
+        macd_line = fast_ema - slow_ema
+        # 시그널 라인 = MACD 라인의 EMA
+        signal_line = TechnicalIndicators._ema_matrix(macd_line, [signal_period])[0]
+        # 히스토그램 = MACD 라인 - 시그널 라인
+        return macd_line, signal_line, macd_line - signal_line
+
     @staticmethod
     def calculate_ema(data: pd.Series, period: int) -> pd.Series:
         """
@@ -40,7 +318,8 @@ class TechnicalIndicators:
         반환값:
             계산된 EMA 값들의 시리즈
         """
-        return data.ewm(span=period, adjust=False).mean()
+        ema = TechnicalIndicators._ema_matrix(data.to_numpy(dtype=np.float64), [period])[0]
+        return pd.Series(ema, index=data.index, name=data.name)
 
     @staticmethod
     def calculate_macd(
@@ -73,17 +352,13 @@ class TechnicalIndicators:
             - MACD가 시그널을 상향 돌파: 매수 신호
             - MACD가 시그널을 하향 돌파: 매도 신호
         """
-        # 빠른 EMA와 느린 EMA 계산
-        fast_ema = TechnicalIndicators.calculate_ema(data, fast_period)
-        slow_ema = TechnicalIndicators.calculate_ema(data, slow_period)
-
-        # MACD 라인 = 빠른 EMA - 느린 EMA
-        macd_line = fast_ema - slow_ema
-        # 시그널 라인 = MACD 라인의 EMA
-        signal_line = TechnicalIndicators.calculate_ema(macd_line, signal_period)
-        # 히스토그램 = MACD 라인 - 시그널 라인
-        macd_histogram = macd_line - signal_line
+        # 빠른 EMA와 느린 EMA를 종가 한 번 순회로 계산
+        fast_ema, slow_ema = TechnicalIndicators._ema_matrix(
+            data.to_numpy(dtype=np.float64), [fast_period, slow_period]
+        )
+        lines = TechnicalIndicators._macd_from_emas(fast_ema, slow_ema, signal_period)
 
+        macd_line, signal_line, macd_histogram = (pd.Series(line, index=data.index) for line in lines)
         return macd_line, signal_line, macd_histogram
 
     @staticmethod
@@ -106,6 +381,11 @@ class TechnicalIndicators:
             - RSI < 30: 과매도 구간 (매수 고려)
             - RSI = 50: 중립
         """
+        if NUMBA_AVAILABLE:
+            out = np.empty(len(data), dtype=np.float64)
+            _rsi_kernel(data.to_numpy(dtype=np.float64), period, out)
+            return pd.Series(out, index=data.index, name=data.name)
+
         # 가격 변화량 계산
         delta = data.diff()
 
@@ -156,10 +436,29 @@ class TechnicalIndicators:
             - 밴드 폭 확대: 변동성 증가
             - 밴드 폭 축소: 변동성 감소 (큰 움직임 임박 가능)
         """
-        # 중간 밴드 (단순 이동 평균)
-        middle_band = data.rolling(window=period).mean()
-        # 표준 편차 계산
-        std = data.rolling(window=period).std()
+        values = data.to_numpy(dtype=np.float64)
+        # 이동 창 방식(numba, TA-Lib)은 NaN 이후 값을 모두 NaN으로 만들므로 NaN이 없을 때만 사용
+        has_nan = np.isnan(values).any()
+
+        if NUMBA_AVAILABLE and not has_nan and period > 1:
+            upper, middle, lower = (np.empty(len(values), dtype=np.float64) for _ in range(3))
+            _bollinger_kernel(values, period, std_dev, upper, middle, lower)
+            return (pd.Series(upper, index=data.index), pd.Series(middle, index=data.index),
+                    pd.Series(lower, index=data.index))
+
+        if talib is not None and not has_nan:
+            # 중간 밴드 (단순 이동 평균)
+            middle_band = pd.Series(talib.SMA(values, timeperiod=period), index=data.index)
+            # 표준 편차 계산 (TA-Lib은 모표준편차이므로 pandas와 같은 표본표준편차로 보정)
+            std = pd.Series(
+                talib.STDDEV(values, timeperiod=period, nbdev=1) * np.sqrt(period / (period - 1)),
+                index=data.index
+            )
+        else:
+            # 중간 밴드 (단순 이동 평균)
+            middle_band = data.rolling(window=period).mean()
+            # 표준 편차 계산
+            std = data.rolling(window=period).std()
 
         # 상단 밴드와 하단 밴드 계산
         upper_band = middle_band + (std * std_dev)
@@ -168,14 +467,19 @@ class TechnicalIndicators:
         return upper_band, middle_band, lower_band
 
     @staticmethod
-    def add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    def add_all_indicators(df: pd.DataFrame, precision: str = 'float32', fused: bool = True) -> pd.DataFrame:
         """
         모든 기술 지표를 데이터프레임에 추가
 
         OHLCV 데이터에 다양한 기술 지표를 계산하여 추가
+        계산은 float64로 누적하고, 결과 컬럼만 precision 자료형으로 저장합니다.
 
         매개변수:
             df: OHLCV 데이터프레임 (필수: 'close' 컬럼)
+            precision: 지표 컬럼 자료형 (기본값: 'float32')
+                      메모리와 저장 용량을 절반으로 줄임. 전체 정밀도가 필요하면 'float64'
+            fused: True면 numba 사용 시 모든 지표를 한 커널에서 계산 (기본값)
+                   False면 지표별로 계산 (numba 사용 시 EMA/MACD, RSI, 볼린저 밴드를 스레드로 동시 계산)
 
         반환값:
             지표가 추가된 데이터프레임
@@ -186,35 +490,79 @@ class TechnicalIndicators:
             - rsi
             - bb_upper, bb_middle, bb_lower
         """
-        df = df.copy()
+        if precision not in ('float32', 'float64'):
+            raise ValueError(f"지원하지 않는 precision: {precision} ('float32' 또는 'float64')")
+        dtype = np.dtype(precision)
 
-        print("EMA 계산 중...")
-        df['ema_12'] = TechnicalIndicators.calculate_ema(df['close'], 12)
-        df['ema_26'] = TechnicalIndicators.calculate_ema(df['close'], 26)
-        df['ema_50'] = TechnicalIndicators.calculate_ema(df['close'], 50)
-        df['ema_200'] = TechnicalIndicators.calculate_ema(df['close'], 200)
+        df = df.copy()
 
-        print("MACD 계산 중...")
-        macd_line, signal_line, macd_histogram = TechnicalIndicators.calculate_macd(df['close'])
+        close = df['close'].to_numpy(dtype=np.float64)
+
+        if fused and NUMBA_AVAILABLE and not np.isnan(close).any():
+            print("EMA, MACD, RSI, 볼린저 밴드 계산 중...")
+            # 모든 지표를 종가 한 번 순회로 계산 (기본 기간: MACD 12/26/9, RSI 14, 볼린저 20/2.0)
+            # 결과 배열은 precision 자료형으로 할당 (내부 상태는 float64로 유지)
+            out = np.empty((len(TechnicalIndicators.INDICATOR_COLUMNS), len(close)), dtype=dtype)
+            _all_indicators_kernel(
+                close,
+                2.0 / (np.asarray(TechnicalIndicators.EMA_PERIODS, dtype=np.float64) + 1.0),
+                2.0 / (9 + 1), 2.0 / (14 + 1), 20, 2.0,
+                out
+            )
+            for name, values in zip(TechnicalIndicators.INDICATOR_COLUMNS, out):
+                df[name] = values
+
+            print("지표 계산 완료")
+            return df
+
+        def ema_macd():
+            # 4개 기간의 EMA를 종가 한 번 순회로 계산
+            emas = TechnicalIndicators._ema_matrix(close, TechnicalIndicators.EMA_PERIODS)
+            # MACD의 빠른/느린 EMA는 ema_12, ema_26 재사용
+            return emas, TechnicalIndicators._macd_from_emas(emas[0], emas[1], signal_period=9)
+
+        # 서로 독립적인 지표 계산 작업
+        jobs = {
+            'EMA/MACD': ema_macd,
+            'RSI': lambda: TechnicalIndicators.calculate_rsi(df['close']),
+            '볼린저 밴드': lambda: TechnicalIndicators.calculate_bollinger_bands(df['close'])
+        }
+
+        if NUMBA_AVAILABLE:
+            # numba 커널은 GIL을 해제하므로 스레드로 동시에 계산
+            print(f"{', '.join(jobs)} 병렬 계산 중...")
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = {name: executor.submit(job) for name, job in jobs.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {}
+            for name, job in jobs.items():
+                print(f"{name} 계산 중...")
+                results[name] = job()
+
+        emas, (macd_line, signal_line, macd_histogram) = results['EMA/MACD']
+        for period, ema in zip(TechnicalIndicators.EMA_PERIODS, emas):
+            df[f'ema_{period}'] = ema
         df['macd'] = macd_line
         df['macd_signal'] = signal_line
         df['macd_histogram'] = macd_histogram
 
-        print("RSI 계산 중...")
-        df['rsi'] = TechnicalIndicators.calculate_rsi(df['close'])
+        df['rsi'] = results['RSI']
 
-        print("볼린저 밴드 계산 중...")
-        bb_upper, bb_middle, bb_lower = TechnicalIndicators.calculate_bollinger_bands(df['close'])
+        bb_upper, bb_middle, bb_lower = results['볼린저 밴드']
         df['bb_upper'] = bb_upper
         df['bb_middle'] = bb_middle
         df['bb_lower'] = bb_lower
 
+        columns = TechnicalIndicators.INDICATOR_COLUMNS
+        df[columns] = df[columns].astype(dtype)
+
         print("지표 계산 완료")
 
         return df
 
     @staticmethod
-    def validate_indicators(df: pd.DataFrame) -> bool:
+    def validate_indicators(df: pd.DataFrame, null_counts: dict = None) -> bool:
         """
         지표 유효성 검증
 
@@ -226,16 +574,12 @@ class TechnicalIndicators:
 
         매개변수:
             df: 지표가 포함된 데이터프레임
+            null_counts: 지표별 NaN 개수를 받을 딕셔너리 (선택, 요약 출력 시 재사용)
 
         반환값:
             유효하면 True
         """
-        required_indicators = [
-            'ema_12', 'ema_26', 'ema_50', 'ema_200',
-            'macd', 'macd_signal', 'macd_histogram',
-            'rsi',
-            'bb_upper', 'bb_middle', 'bb_lower'
-        ]
+        required_indicators = TechnicalIndicators.INDICATOR_COLUMNS
 
         # 지표 존재 확인
         missing = [ind for ind in required_indicators if ind not in df.columns]
@@ -260,6 +604,8 @@ class TechnicalIndicators:
 
         # NaN 통계
         nan_counts = df[required_indicators].isna().sum()
+        if null_counts is not None:
+            null_counts.update({col: int(count) for col, count in nan_counts.items()})
         total_rows = len(df)
         print(f"\n지표 검증:")
         print(f"총 행: {total_rows:,}개")
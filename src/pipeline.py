@@ -7,12 +7,19 @@ import os
 import sys
 from datetime import datetime
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
-# Add src directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from data_collector import DataCollector
-from indicators import TechnicalIndicators
+if __package__:
+    from .data_collector import DataCollector
+    from .indicators import TechnicalIndicators
+else:
+    # Run as a script (python src/pipeline.py): import through the src package like
+    # scripts/* do, so each module is loaded under a single name
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from src.data_collector import DataCollector
+    from src.indicators import TechnicalIndicators
 
 
 class CryptoDataPipeline:
@@ -30,12 +37,14 @@ class CryptoDataPipeline:
         self.timeframe = timeframe
         self.collector = DataCollector(symbol=symbol, timeframe=timeframe)
         self.data = None
+        self._null_counts = {}  # Per-column null counts filled in during validation
         
     def run(
         self,
         start_date: str = None,
         end_date: str = None,
-        output_file: str = None
+        output_file: str = None,
+        verbose: bool = True
     ) -> pd.DataFrame:
         """
         Run the complete pipeline
@@ -43,7 +52,8 @@ class CryptoDataPipeline:
         Args:
             start_date: Start date in format 'YYYY-MM-DD' (optional)
             end_date: End date in format 'YYYY-MM-DD' (optional)
-            output_file: Output CSV file path (optional)
+            output_file: Output file path, .parquet or .csv/.csv.gz (optional)
+            verbose: Print the summary report after saving (default: True)
             
         Returns:
             DataFrame with OHLCV data and technical indicators
@@ -66,7 +76,8 @@ class CryptoDataPipeline:
         
         # Step 2: Validate raw data
         print("\n[Step 2/4] Validating collected data...")
-        if not self.collector.validate_data(self.data):
+        self._null_counts = {}
+        if not self.collector.validate_data(self.data, null_counts=self._null_counts):
             raise ValueError("Data validation failed")
         
         # Step 3: Calculate technical indicators
@@ -78,24 +89,25 @@ class CryptoDataPipeline:
             raise
         
         # Validate indicators
-        if not TechnicalIndicators.validate_indicators(self.data):
+        if not TechnicalIndicators.validate_indicators(self.data, null_counts=self._null_counts):
             raise ValueError("Indicator validation failed")
         
-        # Step 4: Save to CSV
+        # Step 4: Save to file
         if output_file is None:
             # Create default filename with timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_file = f"btc_usdt_1m_{timestamp}.csv"
+            output_file = f"btc_usdt_1m_{timestamp}.parquet"
         
         print(f"\n[Step 4/4] Saving data to {output_file}...")
         try:
-            self.save_to_csv(output_file)
+            self.save(output_file)
         except Exception as e:
             print(f"Error saving data: {e}")
             raise
         
-        # Display summary
-        self.display_summary()
+        # Display summary (skipped for quiet/benchmark runs)
+        if verbose:
+            self.display_summary()
         
         print("\n" + "="*80)
         print("Pipeline completed successfully!")
@@ -103,12 +115,17 @@ class CryptoDataPipeline:
         
         return self.data
     
-    def save_to_csv(self, filename: str):
+    def save(self, filename: str, row_group_size: int = 131072):
         """
-        Save data to CSV file
+        Save data to a file, choosing the format from the extension
+        
+        Files ending in .csv (or .csv.gz, gzip-compressed) are written as text
+        by Arrow's multithreaded CSV writer; anything else is written as ZSTD-compressed Parquet, streamed in row groups
+        so the whole table is never encoded at once.
         
         Args:
             filename: Output file path
+            row_group_size: Rows per Parquet row group (default: 131072)
         """
         if self.data is None:
             raise ValueError("No data to save. Run the pipeline first.")
@@ -118,8 +135,21 @@ class CryptoDataPipeline:
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        # Save to CSV
-        self.data.to_csv(filename, index=False)
+        table = pa.Table.from_pandas(self.data, preserve_index=False)
+        if filename.endswith(('.csv', '.csv.gz')):
+            # Compression is inferred from the extension
+            with pa.output_stream(filename, compression='detect') as sink:
+                pacsv.write_csv(table, sink)
+        else:
+            with pq.ParquetWriter(
+                filename,
+                table.schema,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=False  # float indicator columns rarely repeat
+            ) as writer:
+                for batch in table.to_batches(max_chunksize=row_group_size):
+                    writer.write_batch(batch)
         
         # Get file size
         file_size = os.path.getsize(filename)
@@ -131,6 +161,15 @@ class CryptoDataPipeline:
         print(f"  Rows: {len(self.data)}")
         print(f"  Columns: {len(self.data.columns)}")
     
+    def save_to_csv(self, filename: str):
+        """
+        Save data to CSV file (kept for compatibility, see save)
+        
+        Args:
+            filename: Output file path
+        """
+        self.save(filename)
+    
     def display_summary(self):
         """Display summary statistics"""
         if self.data is None:
@@ -172,17 +211,19 @@ class CryptoDataPipeline:
             print(f"  EMA(200): ${latest['ema_200']:.2f}")
         
         print(f"\nColumn List:")
-        for i, col in enumerate(self.data.columns, 1):
-            print(f"  {i}. {col}")
+        print('\n'.join(f"  {i}. {col}" for i, col in enumerate(self.data.columns, 1)))
         
         print(f"\nData Quality:")
-        null_counts = self.data.isnull().sum()
+        # Reuse the counts from validation when they cover every column
+        if set(self._null_counts) >= set(self.data.columns):
+            null_counts = pd.Series(self._null_counts, dtype='int64').reindex(self.data.columns)
+        else:
+            null_counts = self.data.isnull().sum()
         total_nulls = null_counts.sum()
         print(f"  Total null values: {total_nulls}")
         if total_nulls > 0:
             print(f"  Columns with nulls:")
-            for col, count in null_counts[null_counts > 0].items():
-                print(f"    {col}: {count}")
+            print('\n'.join(f"    {col}: {count}" for col, count in null_counts[null_counts > 0].items()))
 
 
 def main():
@@ -208,7 +249,7 @@ def main():
         '--output',
         type=str,
         default=None,
-        help='출력 CSV 파일 경로 (기본: btc_usdt_1m_TIMESTAMP.csv)'
+        help='출력 파일 경로 (.parquet 또는 .csv/.csv.gz, 기본: btc_usdt_1m_TIMESTAMP.parquet)'
     )
     parser.add_argument(
         '--symbol',
@@ -222,6 +263,11 @@ def main():
         default='1m',
         help='캔들 간격 (기본: 1m)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='완료 후 요약 통계 출력 생략'
+    )
     
     args = parser.parse_args()
     
@@ -232,7 +278,8 @@ def main():
         pipeline.run(
             start_date=args.start_date,
             end_date=args.end_date,
-            output_file=args.output
+            output_file=args.output,
+            verbose=not args.quiet
         )
     except KeyboardInterrupt:
         print("\n\n사용자가 중단했습니다")